@@ -5,13 +5,17 @@ Provides health check and voice verification endpoints for the Janus backend.
 Handles file uploads and voice cloning verification.
 """
 
+import asyncio
+import logging
 import os
 from difflib import SequenceMatcher
 from pathlib import Path
 
 from fastapi import APIRouter, File, HTTPException, UploadFile
 
-from ..services.transcriber import Transcriber
+from ..services.models import get_transcriber
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -52,8 +56,10 @@ async def verify_voice(audio_file: UploadFile = File(...)) -> dict:
             content = await audio_file.read()
             f.write(content)
         
-        transcriber = Transcriber()
-        transcript = transcriber.transcribe_file(str(temp_file_path))
+        # Share the engine's Whisper model rather than loading one per request,
+        # and keep the load and decode off the event loop
+        transcriber = await asyncio.to_thread(get_transcriber)
+        transcript = await asyncio.to_thread(transcriber.transcribe_file, str(temp_file_path))
         
         normalized_transcript = transcript.lower().strip()
         normalized_phrase = VERIFICATION_PHRASE.lower().strip()
@@ -82,5 +88,5 @@ async def verify_voice(audio_file: UploadFile = File(...)) -> dict:
             try:
                 os.remove(temp_file_path)
             except Exception as e:
-                print(f"Warning: Could not remove temp file {temp_file_path}: {e}")
+                logger.warning("Could not remove temp file %s: %s", temp_file_path, e)
 
@@ -7,12 +7,15 @@ and forwards transcript and packet summary events from the engine to the fronten
 
 import asyncio
 import json
+import logging
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
 from ..common import engine_state
 from .types import ControlMessage, JanusOutboundMessage, ControlStateMessage
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -62,10 +65,10 @@ async def janus_ws(websocket: WebSocket) -> None:
             except WebSocketDisconnect:
                 pass
             except Exception as e:
-                print(f"Task failed: {e}")
+                logger.error("Task failed: %s", e)
 
     except Exception as e:
-        print(f"WebSocket handler error: {e}")
+        logger.error("WebSocket handler error: %s", e)
     finally:
         _reset_control_state()
         recv_task.cancel()
@@ -80,7 +83,7 @@ def _reset_control_state() -> None:
     state.is_streaming = False
     state.is_recording = False
     state.is_talking = False
-    print(f"Control State Reset on Disconnect: {state}")
+    logger.info("Control State Reset on Disconnect: %s", state)
 
 
 async def _recv_loop(websocket: WebSocket) -> None:
@@ -106,7 +109,7 @@ async def _recv_loop(websocket: WebSocket) -> None:
     except asyncio.CancelledError:
         raise
     except Exception as e:
-        print(f"Error in recv loop: {e}")
+        logger.error("Error in recv loop: %s", e)
 
 
 def _apply_control_message(msg: ControlMessage) -> None:
@@ -133,7 +136,8 @@ def _apply_control_message(msg: ControlMessage) -> None:
     if msg.emotion_override is not None:
         state.emotion_override = msg.emotion_override
 
-    print(f"Control State Updated: {state}")
+    # Runs per control message; formatted only when debug logging is on
+    logger.debug("Control State Updated: %s", state)
 
 
 async def _send_loop(websocket: WebSocket) -> None:
@@ -170,7 +174,7 @@ async def _send_loop(websocket: WebSocket) -> None:
     except WebSocketDisconnect:
         raise
     except Exception as e:
-        print(f"Error in send loop: {e}")
+        logger.error("Error in send loop: %s", e)
 
 
 async def _send_event(websocket: WebSocket, event: JanusOutboundMessage) -> None:
@@ -38,7 +38,10 @@ class ControlState(BaseModel):
 # Global-ish shared state (within the backend process)
 control_state = ControlState()
 
-# Queues for events emitted by the engine
+# Queues for events emitted by the engine, bounded so a stalled frontend
+# cannot grow memory without limit
+EVENT_QUEUE_MAXSIZE = 256
+
 transcript_queue: Optional[asyncio.Queue] = None
 packet_queue: Optional[asyncio.Queue] = None
 
@@ -52,7 +55,7 @@ def get_transcript_queue() -> asyncio.Queue:
     """
     global transcript_queue
     if transcript_queue is None:
-        transcript_queue = asyncio.Queue()
+        transcript_queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
     return transcript_queue
 
 
@@ -65,7 +68,7 @@ def get_packet_queue() -> asyncio.Queue:
     """
     global packet_queue
     if packet_queue is None:
-        packet_queue = asyncio.Queue()
+        packet_queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
     return packet_queue
 
 
@@ -77,5 +80,5 @@ def reset_queues() -> None:
         None
     """
     global transcript_queue, packet_queue
-    transcript_queue = asyncio.Queue()
-    packet_queue = asyncio.Queue()
+    transcript_queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+    packet_queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
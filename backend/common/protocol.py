@@ -6,11 +6,65 @@ Purpose: Defines the 'Janus Packet' structure and handles the binary serializati
 """
 
 import enum
+import struct
 import time
 from typing import Optional
 
 import msgpack
 
+# Optional numeric prosody fields; normalized to float | None when decoding
+_NUMERIC_PROSODY_KEYS = ('avg_pitch_hz', 'avg_energy')
+
+# Largest serialized packet a receiver accepts. A 30 s utterance is a few
+# hundred bytes of text, and 4 KB already takes ~2 minutes at 300bps, so a
+# larger length prefix can only be corruption or abuse
+MAX_PACKET_BYTES = 4096
+
+# Big-endian u32 length prefix framing each packet on TCP, compiled once
+# rather than per packet
+LENGTH_PREFIX = struct.Struct('>I')
+
+# ProsodyExtractor tags pitch Deep/Normal/High and energy Quiet/Normal/Loud;
+# 'Low' is the older spelling on both axes and is still accepted
+PITCH_TAG_ALIASES = {'Low': 'Deep'}
+ENERGY_TAG_ALIASES = {'Low': 'Quiet'}
+
+# Receiver-side emotion keyed by (pitch, energy) tags; unlisted pairs are Neutral
+RECEIVER_EMOTIONS = {
+    ('High', 'Loud'): 'Excited',
+    ('High', 'Normal'): 'Joyful',
+    ('Deep', 'Loud'): 'Panicked',
+    ('Deep', 'Quiet'): 'Serious',
+}
+
+
+def normalize_prosody_tags(pitch: str, energy: str) -> tuple[str, str]:
+    """
+    Map legacy prosody tag spellings onto the ProsodyExtractor vocabulary.
+    
+    Args:
+        pitch: Pitch tag from a packet's prosody.
+        energy: Energy tag from a packet's prosody.
+    
+    Returns:
+        tuple[str, str]: (pitch, energy) with aliases resolved.
+    """
+    return PITCH_TAG_ALIASES.get(pitch, pitch), ENERGY_TAG_ALIASES.get(energy, energy)
+
+
+def receiver_emotion(prosody: dict) -> str:
+    """
+    Pick the receiver-side emotion for a packet's prosody tags.
+    
+    Args:
+        prosody: Packet prosody dictionary with optional 'pitch' and 'energy'.
+    
+    Returns:
+        str: Emotion name from RECEIVER_EMOTIONS, or 'Neutral'.
+    """
+    tags = normalize_prosody_tags(prosody.get('pitch', 'Normal'), prosody.get('energy', 'Normal'))
+    return RECEIVER_EMOTIONS.get(tags, 'Neutral')
+
 
 class JanusMode(enum.IntEnum):
     """
@@ -21,6 +75,14 @@ class JanusMode(enum.IntEnum):
     MORSE_CODE = 2      # Morse code (local sine wave generation)
 
 
+# Display names used in receiver logs
+MODE_NAMES = {
+    JanusMode.SEMANTIC_VOICE: "Semantic Voice",
+    JanusMode.TEXT_ONLY: "Text Only",
+    JanusMode.MORSE_CODE: "Morse Code",
+}
+
+
 class JanusPacket:
     """
     The Packet Structure for Janus communication.
@@ -80,6 +142,10 @@ class JanusPacket:
         """
         Reconstruct the Packet object from a raw dictionary.
         
+        Validates the prosody payload once here so consumers can trust it: a
+        missing or malformed 'p' becomes an empty dict, and numeric fields
+        ('avg_pitch_hz', 'avg_energy') are floats or None.
+        
         Args:
             data: Dictionary with compact keys ('t', 'm', 'p', 'o', 'ts')
         
@@ -88,31 +154,45 @@ class JanusPacket:
         """
         text = data.get('t', '')
         mode = JanusMode(data.get('m', 0))
-        prosody = data.get('p', {})
+        prosody = data.get('p')
+        if not isinstance(prosody, dict):
+            prosody = {}
+        for key in _NUMERIC_PROSODY_KEYS:
+            if key in prosody:
+                value = prosody[key]
+                prosody[key] = float(value) if isinstance(value, (int, float)) else None
         override_emotion = data.get('o', 'Auto')
         timestamp = data.get('ts', time.time())
         
         return cls(text, mode, prosody, override_emotion, timestamp)
     
-    def serialize(self) -> bytes:
+    def serialize(self, packer: Optional[msgpack.Packer] = None) -> bytes:
         """
         Convert the Packet object into a compact binary byte string.
         
         Uses MessagePack for efficient serialization.
         
+        Args:
+            packer: Optional reusable Packer created with use_bin_type=True.
+                Packers are not thread-safe, so only pass one owned by the
+                calling thread or event loop.
+        
         Returns:
             bytes: Compact binary payload.
         """
         data_dict = self.to_dict()
+        if packer is not None:
+            return packer.pack(data_dict)
         return msgpack.packb(data_dict, use_bin_type=True)
     
     @classmethod
-    def deserialize(cls, payload_bytes: bytes) -> "JanusPacket":
+    def deserialize(cls, payload_bytes: bytes | bytearray | memoryview) -> "JanusPacket":
         """
         Convert binary bytes back into a Packet object.
         
         Args:
-            payload_bytes: Binary payload (bytes)
+            payload_bytes: Binary payload. Any bytes-like object is accepted, so
+                receivers can decode straight from a reusable receive buffer.
         
         Returns:
             JanusPacket: Deserialized packet object
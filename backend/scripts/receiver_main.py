@@ -6,14 +6,18 @@ Purpose: Orchestrates the listening loop, packet deserialization, synthesis, and
 
 import logging
 import os
-import queue
 import socket
-import struct
 import threading
 
 from dotenv import load_dotenv
 
-from backend.common.protocol import JanusMode, JanusPacket
+from backend.common.protocol import (
+    LENGTH_PREFIX,
+    MAX_PACKET_BYTES,
+    MODE_NAMES,
+    JanusPacket,
+    receiver_emotion,
+)
 from backend.services.audio_io import AudioService
 from backend.services.synthesizer import Synthesizer
 
@@ -21,63 +25,38 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def recv_exact(sock: socket.socket, n: int) -> bytes | None:
+# MSG_WAITALL lets the kernel fill the whole request in one recv call where supported
+_MSG_WAITALL = getattr(socket, "MSG_WAITALL", 0)
+
+# Largest UDP datagram accepted from the sender
+UDP_BUFFER_BYTES = 4096
+
+
+def recv_into_exact(sock: socket.socket, view: memoryview) -> bool:
     """
-    Helper function to receive exactly n bytes from a socket.
+    Helper function to fill a buffer view completely from a socket.
     Handles fragmented reads that can occur with TCP.
     
+    Reads with MSG_WAITALL so a complete frame normally arrives in a single
+    syscall, directly into the caller's reusable buffer. Short reads are
+    resumed at the current offset.
+    
     Args:
         sock: The socket to read from.
-        n: Number of bytes to read.
+        view: Writable memoryview to fill; its length is the byte count read.
         
     Returns:
-        bytes | None: Exactly n bytes, or None if connection closed
+        bool: True once the view is full, False if the connection closed
             before all bytes are received.
     """
-    data = b''
-    while len(data) < n:
-        packet = sock.recv(n - len(data))
-        if not packet:
-            return None  # Connection closed
-        data += packet
-    return data
-
-
-def playback_worker(
-    audio_service: AudioService,
-    playback_queue: queue.Queue[bytes],
-    stop_event: threading.Event,
-) -> None:
-    """
-    Playback thread worker function.
-    
-    Continuously pulls audio bytes from queue and plays them.
-    Prevents blocking the main receiver loop.
-    
-    Args:
-        audio_service: AudioService instance for playback.
-        playback_queue: Queue containing audio bytes to play.
-        stop_event: Threading event to signal shutdown. Worker exits when
-            this event is set.
-    
-    Returns:
-        None
-    """
-    while not stop_event.is_set():
-        try:
-            try:
-                audio_bytes = playback_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
-            
-            if audio_bytes:
-                audio_service.write_chunk(audio_bytes)
-            
-            playback_queue.task_done()
-            
-        except Exception as e:
-            logger.error(f"Playback error: {e}")
-            playback_queue.task_done()
+    n = len(view)
+    received = 0
+    while received < n:
+        count = sock.recv_into(view[received:], n - received, _MSG_WAITALL)
+        if not count:
+            return False  # Connection closed
+        received += count
+    return True
 
 
 def receiver_loop(stop_event: threading.Event | None = None) -> None:
@@ -120,13 +99,17 @@ def receiver_loop(stop_event: threading.Event | None = None) -> None:
         listen_sock.listen(1)
         logger.info(f"Listening for Transmissions on TCP port {receiver_port}...")
         sock, addr = listen_sock.accept()
+        # Notice a sender that vanished without closing the connection
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         logger.info(f"Connection established from {addr}")
     else:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.bind(('0.0.0.0', receiver_port))
         logger.info(f"Listening for Transmissions on UDP port {receiver_port}...")
     
-    playback_queue = queue.Queue(maxsize=100)
+    # Reused for every packet; msgpack decodes directly from these views
+    header_view = memoryview(bytearray(4))
+    recv_buffer = bytearray(max(MAX_PACKET_BYTES, UDP_BUFFER_BYTES))
     
     # Use provided stop_event or create internal one
     if stop_event is None:
@@ -135,13 +118,6 @@ def receiver_loop(stop_event: threading.Event | None = None) -> None:
     else:
         use_keyboard_interrupt = False
     
-    playback_thread = threading.Thread(
-        target=playback_worker,
-        args=(audio_service, playback_queue, stop_event),
-        daemon=True
-    )
-    playback_thread.start()
-
     try:
         while True:
             # Exit if stop_event is set (test mode)
@@ -150,23 +126,30 @@ def receiver_loop(stop_event: threading.Event | None = None) -> None:
                 
             try:
                 if use_tcp:
-                    length_bytes = recv_exact(sock, 4)
-                    if length_bytes is None:
+                    if not recv_into_exact(sock, header_view):
                         logger.info("Connection closed by sender")
                         break
                     
-                    payload_length = struct.unpack('>I', length_bytes)[0]
-                    data = recv_exact(sock, payload_length)
-                    if data is None:
+                    payload_length = LENGTH_PREFIX.unpack(header_view)[0]
+                    # A bad length prefix leaves the stream unrecoverable
+                    if payload_length > MAX_PACKET_BYTES:
+                        logger.warning(
+                            "Packet length %d exceeds %d bytes, closing connection",
+                            payload_length, MAX_PACKET_BYTES,
+                        )
+                        break
+                    data = memoryview(recv_buffer)[:payload_length]
+                    if not recv_into_exact(sock, data):
                         logger.info("Connection closed while reading packet")
                         break
                 else:
                     # Set timeout for UDP to allow periodic stop_event checking
                     sock.settimeout(0.5)
                     try:
-                        data, addr = sock.recvfrom(4096)
+                        nbytes, addr = sock.recvfrom_into(recv_buffer, UDP_BUFFER_BYTES)
                     except socket.timeout:
                         continue
+                    data = memoryview(recv_buffer)[:nbytes]
 
                 try:
                     packet = JanusPacket.deserialize(data)
@@ -177,27 +160,9 @@ def receiver_loop(stop_event: threading.Event | None = None) -> None:
                 if packet.override_emotion != "Auto":
                     emotion_tag = packet.override_emotion
                 else:
-                    prosody = packet.prosody
-                    pitch = prosody.get('pitch', 'Normal')
-                    energy = prosody.get('energy', 'Normal')
-                    
-                    if pitch == 'High' and energy == 'Loud':
-                        emotion_tag = 'Excited'
-                    elif pitch == 'High' and energy == 'Normal':
-                        emotion_tag = 'Joyful'
-                    elif pitch == 'Low' and energy == 'Loud':
-                        emotion_tag = 'Panicked'
-                    elif pitch == 'Low' and energy in ('Quiet', 'Low'):
-                        emotion_tag = 'Serious'
-                    else:
-                        emotion_tag = 'Neutral'
+                    emotion_tag = receiver_emotion(packet.prosody)
                 
-                mode_names = {
-                    JanusMode.SEMANTIC_VOICE: "Semantic Voice",
-                    JanusMode.TEXT_ONLY: "Text Only",
-                    JanusMode.MORSE_CODE: "Morse Code"
-                }
-                mode_name = mode_names.get(packet.mode, "Unknown")
+                mode_name = MODE_NAMES.get(packet.mode, "Unknown")
                 
                 logger.info(f"[RECEIVED] [{mode_name}] '{packet.text}'")
                 logger.debug(f"   Meta: Energy={packet.prosody.get('energy', 'N/A')}, "
@@ -209,10 +174,11 @@ def receiver_loop(stop_event: threading.Event | None = None) -> None:
                     logger.error(f"Synthesis error: {e}")
                     continue
 
-                try:
-                    playback_queue.put(audio_bytes, timeout=0.1)
-                except queue.Full:
-                    logger.warning("Playback queue full, skipping audio chunk")
+                # write_chunk only queues the utterance for the output callback,
+                # and drops older queued utterances when backlogged, so playback
+                # never blocks the network read
+                if audio_bytes:
+                    audio_service.write_chunk(audio_bytes)
 
             except KeyboardInterrupt:
                 break
@@ -223,7 +189,6 @@ def receiver_loop(stop_event: threading.Event | None = None) -> None:
     finally:
         logger.info("Shutting down...")
         stop_event.set()
-        playback_thread.join(timeout=2)
         
         if sock:
             sock.close()
@@ -7,16 +7,20 @@ Purpose: Orchestrates the Audio, VAD, Transcription, and Prosody services.
 
 import logging
 import os
-import queue
 import threading
 import time
-from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
 from backend.common.protocol import JanusMode, JanusPacket
-from backend.services.audio_io import AudioService
+from backend.services.audio_io import (
+    MAX_UTTERANCE_SECONDS,
+    AudioService,
+    ChunkRing,
+    PreRollBuffer,
+    UtteranceBuffer,
+)
 from backend.services.link_simulator import LinkSimulator
 from backend.services.prosody import ProsodyExtractor
 from backend.services.transcriber import Transcriber
@@ -25,33 +29,46 @@ from backend.services.vad import VoiceActivityDetector
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
 def audio_producer(
     audio_service: AudioService,
-    audio_queue: queue.Queue[np.ndarray],
+    audio_ring: ChunkRing,
     stop_event: threading.Event,
 ) -> None:
     """
     Audio producer thread worker function.
     
-    Continuously reads audio chunks from the audio service and places them in the queue
-    for processing. Runs until stop_event is set. Never stops reading to prevent
-    PyAudio buffer overflow.
+    Continuously reads audio chunks from the audio service directly into the
+    capture ring's preallocated slots for processing. Runs until stop_event is
+    set. Never stops reading to prevent PyAudio buffer overflow: while the ring
+    is full, a chunk is held in a scratch buffer for up to 100ms and dropped if
+    no slot frees up.
     
     Args:
         audio_service: AudioService instance for reading audio input.
-        audio_queue: Queue for storing audio chunks (numpy arrays).
+        audio_ring: Single-producer/single-consumer ring of capture chunks.
         stop_event: Threading event to signal shutdown. Producer exits when set.
     
     Returns:
         None
     """
+    overflow = np.empty(audio_ring.chunk_size, dtype=np.float32)
     while not stop_event.is_set():
         try:
-            chunk = audio_service.read_chunk()
-            try:
-                audio_queue.put(chunk, timeout=0.1)
-            except queue.Full:
-                pass
+            slot = audio_ring.acquire()
+            if slot is not None:
+                audio_ring.commit(audio_service.read_chunk_into(slot))
+                continue
+            
+            # Ring full: give the consumer up to 100ms to free a slot before dropping
+            n = audio_service.read_chunk_into(overflow)
+            for _ in range(10):
+                time.sleep(0.01)
+                slot = audio_ring.acquire()
+                if slot is not None:
+                    slot[:n] = overflow[:n]
+                    audio_ring.commit(n)
+                    break
         except Exception as e:
             logger.error(f"Error in audio producer: {e}")
 
@@ -62,7 +79,7 @@ def audio_consumer(
     transcriber: Transcriber,
     prosody_tool: ProsodyExtractor,
     link_simulator: LinkSimulator,
-    audio_queue: queue.Queue[np.ndarray],
+    audio_ring: ChunkRing,
     executor: ThreadPoolExecutor,
     stop_event: threading.Event,
 ) -> None:
@@ -79,7 +96,7 @@ def audio_consumer(
         transcriber: Transcriber instance for speech-to-text conversion.
         prosody_tool: ProsodyExtractor instance for emotion metadata extraction.
         link_simulator: LinkSimulator instance for packet transmission.
-        audio_queue: Queue containing audio chunks (numpy arrays) to process.
+        audio_ring: Capture ring filled by audio_producer.
         stop_event: Threading event to signal shutdown. Consumer exits when set.
     
     Returns:
@@ -87,8 +104,16 @@ def audio_consumer(
     """
     is_streaming_mode = True
     is_recording_hold = False
-    audio_buffer = []
-    pre_roll_buffer = deque(maxlen=10)  # ~320ms of audio at 48kHz
+    # Chunks are copied into preallocated storage, so the ring can be drained
+    # into one scratch array instead of allocating per chunk. Two utterance
+    # buffers alternate so the executor can read one while the other fills.
+    utterance_samples = MAX_UTTERANCE_SECONDS * audio_service.SAMPLE_RATE
+    utterance_buffers = [UtteranceBuffer(utterance_samples), UtteranceBuffer(utterance_samples)]
+    pending_jobs = [None, None]
+    current_buffer = 0
+    audio_buffer = utterance_buffers[current_buffer]
+    pre_roll_buffer = PreRollBuffer(10, audio_ring.chunk_size)  # ~320ms of audio at 48kHz
+    chunk_scratch = np.empty(audio_ring.chunk_size, dtype=np.float32)
     silence_counter = 0
     SILENCE_THRESHOLD_CHUNKS = 15  # ~480ms
     
@@ -140,10 +165,9 @@ def audio_consumer(
 
     while not stop_event.is_set():
         try:
-            try:
-                chunk = audio_queue.get(timeout=0.1)
-            except queue.Empty:
+            if not audio_ring.wait(0.1):
                 continue
+            chunk = audio_ring.pop_into(chunk_scratch)
             
             chunk_counter += 1
             if chunk_counter % 100 == 0:
@@ -154,7 +178,6 @@ def audio_consumer(
             if is_recording_hold:
                 audio_buffer.append(chunk)
                 previous_hold_state = True
-                audio_queue.task_done()
                 continue
             
             if previous_hold_state and not is_recording_hold:
@@ -169,7 +192,7 @@ def audio_consumer(
                     if len(audio_buffer) == 0:
                         logger.info("Speech detected - start buffering (with pre-roll).")
                         # Prepend the pre-roll history
-                        audio_buffer.extend(list(pre_roll_buffer))
+                        audio_buffer.extend(pre_roll_buffer)
                     
                     audio_buffer.append(chunk)
                     silence_counter = 0
@@ -189,27 +212,30 @@ def audio_consumer(
                             silence_counter = 0 # Reset without trigger
             
             else:
-                audio_queue.task_done()
                 continue
             
             if trigger_processing and len(audio_buffer) > 0:
-                combined_audio = np.concatenate(audio_buffer)
-                audio_buffer = []
                 silence_counter = 0
                 
-                # Submit to executor instead of blocking
-                executor.submit(
+                # Submit to executor instead of blocking; it reads the buffer in place
+                pending_jobs[current_buffer] = executor.submit(
                     process_and_transmit, 
-                    combined_audio, 
+                    audio_buffer.view(), 
                     transmission_mode, 
                     override_emotion
                 )
-            
-            audio_queue.task_done()
+                
+                current_buffer ^= 1
+                job = pending_jobs[current_buffer]
+                if job is not None and not job.done():
+                    # Both buffers are still being processed; never overwrite one in use
+                    utterance_buffers[current_buffer] = UtteranceBuffer(utterance_samples)
+                pending_jobs[current_buffer] = None
+                audio_buffer = utterance_buffers[current_buffer]
+                audio_buffer.clear()
             
         except Exception as e:
             logger.error(f"Error in audio consumer: {e}")
-            audio_queue.task_done()
 
 
 def main_loop(stop_event: threading.Event | None = None) -> None:
@@ -242,7 +268,7 @@ def main_loop(stop_event: threading.Event | None = None) -> None:
     logger.info(f"Link Simulator: {target_ip}:{target_port} ({'TCP' if use_tcp else 'UDP'})")
     link_simulator = LinkSimulator(target_ip=target_ip, target_port=target_port, use_tcp=use_tcp)
     
-    audio_queue = queue.Queue(maxsize=100)
+    audio_ring = ChunkRing(100, audio_service.CHUNK_SIZE)
     
     # Use provided stop_event or create internal one
     if stop_event is None:
@@ -255,14 +281,14 @@ def main_loop(stop_event: threading.Event | None = None) -> None:
 
     producer_thread = threading.Thread(
         target=audio_producer,
-        args=(audio_service, audio_queue, stop_event),
+        args=(audio_service, audio_ring, stop_event),
         daemon=True
     )
     producer_thread.start()
     
     consumer_thread = threading.Thread(
         target=audio_consumer,
-        args=(audio_service, vad_model, transcriber, prosody_tool, link_simulator, audio_queue, executor, stop_event),
+        args=(audio_service, vad_model, transcriber, prosody_tool, link_simulator, audio_ring, executor, stop_event),
         daemon=True
     )
     consumer_thread.start()
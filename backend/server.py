@@ -1,8 +1,10 @@
 import asyncio
+import atexit
 import logging
 import os
-import threading
-from logging.handlers import RotatingFileHandler
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -26,15 +28,30 @@ file_handler.setFormatter(
     logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
 
+# Records are handed to a background listener so file rotation and console
+# writes never block the audio and network threads that emit them.
+log_queue: queue.Queue = queue.Queue(-1)
+log_listener = QueueListener(
+    log_queue, file_handler, logging.StreamHandler(), respect_handler_level=True
+)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    handlers=[
-        file_handler,
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# Default executor for every asyncio.to_thread offload: the sender's batched
+# VAD catch-up and its transcription + prosody pair (at most two at once, as
+# one task awaits them in turn), receiver synthesis (one), and the
+# /api/voice/verify model load and transcription (one per request). Four
+# workers cover both loops at their peak plus a verify request; further
+# verify requests queue behind it rather than adding Whisper runs to an
+# already busy CPU
+CPU_WORKERS = 4
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -42,7 +59,7 @@ async def lifespan(app: FastAPI):
     Application lifespan context manager.
     
     Manages startup and shutdown of the Smart Ear engine, including audio service
-    initialization, background tasks, and receiver loop thread.
+    initialization and the engine and receiver background tasks.
     
     Args:
         app: FastAPI application instance.
@@ -52,18 +69,17 @@ async def lifespan(app: FastAPI):
     """
     logger.info("Starting Smart Ear Engine...")
 
+    # Both background loops offload through asyncio.to_thread, so one named
+    # default executor serves the sender and receiver pipelines
+    cpu_executor = ThreadPoolExecutor(max_workers=CPU_WORKERS, thread_name_prefix="janus-cpu")
+    asyncio.get_running_loop().set_default_executor(cpu_executor)
+
     # Initialize shared AudioService for full-duplex audio
     global_audio_service = AudioService()
-    
-    # Create stop event for receiver loop
-    receiver_stop_event = threading.Event()
 
     # Ensure queues are initialized on the running loop
     transcript_queue = engine_state.get_transcript_queue()
     packet_queue = engine_state.get_packet_queue()
-    
-    # Get the event loop for async operations in receiver_loop
-    event_loop = asyncio.get_running_loop()
 
     # Launch the Smart Ear engine as a background task
     task = asyncio.create_task(
@@ -75,13 +91,8 @@ async def lifespan(app: FastAPI):
         )
     )
 
-    # Start receiver loop in a separate thread
-    receiver_thread = threading.Thread(
-        target=receiver_loop,
-        args=(global_audio_service, receiver_stop_event, event_loop),
-        daemon=True
-    )
-    receiver_thread.start()
+    # Receiver shares the event loop; it awaits socket readiness instead of blocking
+    receiver_task = asyncio.create_task(receiver_loop(global_audio_service))
     logger.info("Receiver loop started.")
 
     yield
@@ -89,21 +100,17 @@ async def lifespan(app: FastAPI):
     # Shutdown logic
     logger.info("Shutting down...")
     
-    # Signal receiver loop to stop
-    receiver_stop_event.set()
-    
-    # Wait for receiver thread to finish (with timeout)
-    receiver_thread.join(timeout=2)
-    
-    # Cancel the Smart Ear engine task
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    # Cancel the receiver and the Smart Ear engine tasks
+    for background_task in (receiver_task, task):
+        background_task.cancel()
+        try:
+            await background_task
+        except asyncio.CancelledError:
+            pass
     
     # Close shared audio service
     global_audio_service.close()
+    cpu_executor.shutdown(wait=False, cancel_futures=True)
     
     logger.info("Smart Ear Engine stopped.")
 
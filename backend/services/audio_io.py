@@ -5,16 +5,333 @@ Purpose: Handles the raw interface with the microphone and speakers using PyAudi
          which are required for AI processing.
 """
 
+import collections
 import logging
+import threading
 import time
 import warnings
-from typing import Union
+from typing import Callable, Union
 
 import numpy as np
 import pyaudio
 
 logger = logging.getLogger(__name__)
 
+# Whole queued utterances beyond this are dropped oldest-first to bound receive latency
+PLAYBACK_MAX_BACKLOG_SECONDS = 10
+
+# Initial utterance buffer length; grows on demand for longer holds
+MAX_UTTERANCE_SECONDS = 30
+
+
+class PlaybackQueue:
+    """
+    Queue of int16 utterances drained by the PortAudio output callback.
+
+    The receiver enqueues each synthesized utterance whole with write() while
+    the output callback drains it with read_into(). Every utterance keeps its
+    own array, so there is no fixed capacity to overflow and long clips play
+    in full.
+
+    With max_backlog set, a write that leaves more than max_backlog samples
+    queued drops whole utterances that have not started playing, oldest
+    first. The utterance currently playing and the one just written are never
+    cut, so a message is either heard intact or not at all. A lock guards the
+    deque; the callback holds it only while copying one buffer of samples.
+    """
+
+    def __init__(self, max_backlog: int | None = None) -> None:
+        """
+        Args:
+            max_backlog: Optional cap on queued samples; older queued
+                utterances beyond it are dropped in favour of newer writes.
+        """
+        self._utterances: collections.deque[np.ndarray] = collections.deque()
+        self._max_backlog = max_backlog
+        self._offset = 0  # Samples of the head utterance already played
+        self._queued = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of samples queued and not yet played."""
+        return self._queued
+
+    def write(self, samples: np.ndarray) -> int:
+        """
+        Enqueue one utterance, dropping older queued utterances beyond max_backlog.
+
+        Args:
+            samples: int16 PCM samples; copied, so the caller may reuse its buffer.
+
+        Returns:
+            int: Number of samples dropped from older queued utterances.
+        """
+        if not len(samples):
+            return 0
+        utterance = np.array(samples, dtype=np.int16)
+
+        dropped = 0
+        with self._lock:
+            self._utterances.append(utterance)
+            self._queued += len(utterance)
+            if self._max_backlog is not None:
+                # The head is only eligible while none of it has been played
+                first = 1 if self._offset else 0
+                while self._queued > self._max_backlog and len(self._utterances) - 1 > first:
+                    stale = self._utterances[first]
+                    del self._utterances[first]
+                    self._queued -= len(stale)
+                    dropped += len(stale)
+        return dropped
+
+    def read_into(self, out: np.ndarray) -> int:
+        """
+        Drain up to len(out) samples into out, zero-filling any shortfall.
+
+        Args:
+            out: Preallocated int16 array to fill.
+
+        Returns:
+            int: Number of queued samples copied (the rest of out is silence).
+        """
+        n = 0
+        with self._lock:
+            while n < len(out) and self._utterances:
+                head = self._utterances[0]
+                take = min(len(out) - n, len(head) - self._offset)
+                out[n:n + take] = head[self._offset:self._offset + take]
+                n += take
+                self._offset += take
+                if self._offset == len(head):
+                    self._utterances.popleft()
+                    self._offset = 0
+            self._queued -= n
+        out[n:] = 0
+        return n
+
+
+class ChunkRing:
+    """
+    Single-producer / single-consumer ring of fixed-size float32 capture chunks.
+
+    Chunk storage is one preallocated 2D array, so the capture thread never
+    allocates per chunk and neither side takes a lock on the data path. The
+    consumer copies each chunk out with pop_into() before releasing its slot,
+    so a producer that laps the ring cannot overwrite audio still in use.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        chunk_size: int,
+        on_commit: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            capacity: Maximum number of chunks held before pushes are dropped.
+            chunk_size: Maximum samples per chunk.
+            on_commit: Optional callback run on the producer thread after each
+                chunk is published, e.g. to wake an asyncio consumer.
+        """
+        self._slots = np.zeros((capacity, chunk_size), dtype=np.float32)
+        self._lengths = np.zeros(capacity, dtype=np.int64)
+        self._capacity = capacity
+        self._head = 0
+        self._tail = 0
+        self._data_ready = threading.Event()
+        self._on_commit = on_commit
+
+    def __len__(self) -> int:
+        """Number of chunks waiting to be consumed."""
+        return self._tail - self._head
+
+    @property
+    def chunk_size(self) -> int:
+        """Maximum samples per chunk."""
+        return self._slots.shape[1]
+
+    def push(self, chunk: np.ndarray) -> bool:
+        """
+        Copy a chunk into the next free slot (producer side).
+
+        Args:
+            chunk: float32 samples; truncated to the slot size if longer.
+
+        Returns:
+            bool: False if the ring was full and the chunk was dropped.
+        """
+        slot = self.acquire()
+        if slot is None:
+            return False
+        n = min(len(chunk), len(slot))
+        slot[:n] = chunk[:n]
+        self.commit(n)
+        return True
+
+    def acquire(self) -> np.ndarray | None:
+        """
+        Borrow the next free slot for the producer to fill in place.
+
+        The slot is not visible to the consumer until commit() is called.
+
+        Returns:
+            np.ndarray | None: Writable view of the slot, or None if the ring is full.
+        """
+        if self._tail - self._head >= self._capacity:
+            return None
+        return self._slots[self._tail % self._capacity]
+
+    def commit(self, length: int) -> None:
+        """
+        Publish the slot returned by acquire() with its first length samples.
+
+        Args:
+            length: Number of valid samples written into the slot.
+        """
+        self._lengths[self._tail % self._capacity] = length
+        self._tail += 1
+        self._data_ready.set()
+        if self._on_commit is not None:
+            self._on_commit()
+
+    def pop_into(self, out: np.ndarray) -> np.ndarray | None:
+        """
+        Copy the oldest chunk into out and release its slot (consumer side).
+
+        Args:
+            out: Preallocated float32 array of at least chunk_size samples.
+
+        Returns:
+            np.ndarray | None: View of out holding the chunk, or None if empty.
+        """
+        if self._tail == self._head:
+            return None
+        slot = self._head % self._capacity
+        n = int(self._lengths[slot])
+        out[:n] = self._slots[slot, :n]
+        self._head += 1
+        return out[:n]
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Block until a chunk is available or the timeout elapses.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if at least one chunk is available.
+        """
+        self._data_ready.clear()
+        if len(self):
+            return True
+        return self._data_ready.wait(timeout)
+
+
+class UtteranceBuffer:
+    """
+    Growable float32 buffer that accumulates an utterance chunk by chunk.
+
+    Chunks are copied into one preallocated array and the utterance is handed
+    out as a view, so triggering does not allocate and copy a new array
+    proportional to the utterance length.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Args:
+            capacity: Initial capacity in samples. Doubled on overflow.
+        """
+        self._buf = np.empty(capacity, dtype=np.float32)
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of samples currently buffered."""
+        return self._size
+
+    def append(self, chunk: np.ndarray) -> None:
+        """
+        Copy a chunk onto the end of the buffer, growing it if necessary.
+
+        Args:
+            chunk: float32 audio samples.
+        """
+        end = self._size + len(chunk)
+        if end > len(self._buf):
+            grown = np.empty(max(end, 2 * len(self._buf)), dtype=np.float32)
+            grown[:self._size] = self._buf[:self._size]
+            self._buf = grown
+        self._buf[self._size:end] = chunk
+        self._size = end
+
+    def extend(self, chunks) -> None:
+        """
+        Append each chunk of an iterable in order.
+
+        Args:
+            chunks: Iterable of float32 audio chunks.
+        """
+        for chunk in chunks:
+            self.append(chunk)
+
+    def view(self) -> np.ndarray:
+        """
+        Return the buffered samples without copying.
+
+        Returns:
+            np.ndarray: View of the buffered samples. Only valid until the next
+                append after clear().
+        """
+        return self._buf[:self._size]
+
+    def clear(self) -> None:
+        """Discard the buffered samples, keeping the allocation for reuse."""
+        self._size = 0
+
+
+class PreRollBuffer:
+    """
+    Fixed ring of the most recent capture chunks, replayed when speech starts.
+
+    Chunks are copied into preallocated rows, overwriting the oldest once the
+    ring is full, so idle listening does not allocate an array per chunk.
+    """
+
+    def __init__(self, chunks: int, chunk_size: int) -> None:
+        """
+        Args:
+            chunks: Number of most recent chunks retained.
+            chunk_size: Maximum samples per chunk.
+        """
+        self._slots = np.empty((chunks, chunk_size), dtype=np.float32)
+        self._lengths = np.zeros(chunks, dtype=np.int64)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Number of chunks currently retained."""
+        return min(self._count, len(self._slots))
+
+    def append(self, chunk: np.ndarray) -> None:
+        """
+        Copy a chunk into the ring, evicting the oldest if full.
+
+        Args:
+            chunk: float32 samples; truncated to the slot size if longer.
+        """
+        slot = self._count % len(self._slots)
+        n = min(len(chunk), self._slots.shape[1])
+        self._slots[slot, :n] = chunk[:n]
+        self._lengths[slot] = n
+        self._count += 1
+
+    def __iter__(self):
+        """Yield views of the retained chunks, oldest first."""
+        capacity = len(self._slots)
+        for i in range(self._count - len(self), self._count):
+            slot = i % capacity
+            yield self._slots[slot, :self._lengths[slot]]
+
+
 class AudioService:
     def __init__(self):
         """
@@ -30,6 +347,25 @@ class AudioService:
         self.CHANNELS = 1
         self.FORMAT = pyaudio.paInt16
         
+        # float32 scalar operand so int16 -> float32 conversion resolves to the
+        # float32 multiply loop instead of promoting through float64
+        self._scale = np.float32(1.0 / 32768.0)
+        
+        # Playback is fed through a queue drained by the PortAudio output callback,
+        # so callers never block on the speaker. Older queued utterances are
+        # dropped once the backlog would exceed PLAYBACK_MAX_BACKLOG_SECONDS
+        self._playback_queue = PlaybackQueue(
+            max_backlog=self.SAMPLE_RATE * PLAYBACK_MAX_BACKLOG_SECONDS,
+        )
+        self._playback_out = np.zeros(self.CHUNK_SIZE, dtype=np.int16)
+        
+        # Optional in-place int16 filter (e.g. ducking) run by the output callback
+        # on each buffer as it is played, so it reflects state at play time
+        self.playback_filter: Callable[[np.ndarray], None] | None = None
+        
+        # Set by start_capture() while the input callback feeds a ChunkRing
+        self._capture_ring = None
+        
         # Safety flag for hardware availability
         self._pyaudio_available = False
         
@@ -49,26 +385,7 @@ class AudioService:
             return
         
         # Try to open input stream (microphone)
-        try:
-            self.input_stream = self.pyaudio_instance.open(
-                format=self.FORMAT,
-                channels=self.CHANNELS,
-                rate=self.SAMPLE_RATE,
-                input=True,
-                frames_per_buffer=self.CHUNK_SIZE
-            )
-            logger.info("Audio input stream opened successfully.")
-        except Exception as e:
-            warnings.warn(f"Failed to open audio input stream: {e}. Input will be disabled.")
-            logger.error(f"Audio input stream error: {e}")
-            # Ensure stream is None if opening failed
-            if self.input_stream is not None:
-                try:
-                    self.input_stream.stop_stream()
-                    self.input_stream.close()
-                except Exception:
-                    pass
-                self.input_stream = None
+        self.input_stream = self._open_input_stream()
         
         # Try to open output stream (speakers)
         try:
@@ -77,7 +394,8 @@ class AudioService:
                 channels=self.CHANNELS,
                 rate=self.SAMPLE_RATE,
                 output=True,
-                frames_per_buffer=self.CHUNK_SIZE
+                frames_per_buffer=self.CHUNK_SIZE,
+                stream_callback=self._playback_callback
             )
             logger.info("Audio output stream opened successfully.")
         except Exception as e:
@@ -98,6 +416,109 @@ class AudioService:
         else:
             logger.warning("AudioService initialized but no streams available. Running in Silent/Mock mode.")
 
+    def _open_input_stream(self, stream_callback=None):
+        """
+        Open the microphone stream, in blocking mode or driven by a callback.
+        
+        Args:
+            stream_callback: Optional PortAudio callback. When None the stream
+                is opened for blocking read_chunk() calls.
+        
+        Returns:
+            The opened PyAudio stream, or None if it could not be opened.
+        """
+        stream = None
+        try:
+            stream = self.pyaudio_instance.open(
+                format=self.FORMAT,
+                channels=self.CHANNELS,
+                rate=self.SAMPLE_RATE,
+                input=True,
+                frames_per_buffer=self.CHUNK_SIZE,
+                stream_callback=stream_callback
+            )
+            logger.info("Audio input stream opened successfully.")
+            return stream
+        except Exception as e:
+            warnings.warn(f"Failed to open audio input stream: {e}. Input will be disabled.")
+            logger.error(f"Audio input stream error: {e}")
+            # Ensure stream is None if opening failed
+            if stream is not None:
+                try:
+                    stream.stop_stream()
+                    stream.close()
+                except Exception:
+                    pass
+            return None
+
+    def _reopen_input_stream(self, stream_callback=None) -> None:
+        """Replace the open input stream with one in the requested mode."""
+        if self.input_stream is not None:
+            try:
+                self.input_stream.stop_stream()
+                self.input_stream.close()
+            except Exception:
+                pass
+        self.input_stream = self._open_input_stream(stream_callback)
+
+    def start_capture(self, ring: ChunkRing) -> bool:
+        """
+        Deliver microphone chunks straight into ring from the PortAudio callback.
+        
+        Replaces a reader thread polling read_chunk_into(): PortAudio's own
+        thread converts each buffer into a ring slot, so there is no extra
+        thread hop between the device and the consumer. Chunks are dropped
+        while the ring is full.
+        
+        Args:
+            ring: Capture ring sized for CHUNK_SIZE chunks.
+        
+        Returns:
+            bool: True if callback capture is running. False when no input
+                hardware is available; the caller should poll read_chunk_into()
+                instead.
+        """
+        if not self._pyaudio_available or self.input_stream is None:
+            return False
+        
+        self._capture_ring = ring
+        self._reopen_input_stream(self._capture_callback)
+        if self.input_stream is None:
+            self._capture_ring = None
+            self._reopen_input_stream()
+            return False
+        return True
+
+    def stop_capture(self) -> None:
+        """
+        Stop callback capture and restore the blocking input stream.
+        
+        Returns:
+            None
+        """
+        if self._capture_ring is None:
+            return
+        self._capture_ring = None
+        if self.pyaudio_instance is not None:
+            self._reopen_input_stream()
+
+    def _capture_callback(self, in_data, frame_count, time_info, status):
+        """
+        PortAudio input callback; converts the buffer into a capture ring slot.
+        
+        Returns:
+            tuple: (None, pyaudio.paContinue)
+        """
+        ring = self._capture_ring
+        if ring is not None:
+            slot = ring.acquire()
+            if slot is not None:
+                audio_int16 = np.frombuffer(in_data, dtype=np.int16)
+                n = min(len(audio_int16), len(slot))
+                np.multiply(audio_int16[:n], self._scale, out=slot[:n], casting='unsafe')
+                ring.commit(n)
+        return None, pyaudio.paContinue
+
     def read_chunk(self) -> np.ndarray:
         """
         Reads a single chunk of audio from the microphone stream.
@@ -123,17 +544,49 @@ class AudioService:
             raw_data = b'\x00' * (self.CHUNK_SIZE * 2)
         
         audio_int16 = np.frombuffer(raw_data, dtype=np.int16)
-        audio_float32 = audio_int16.astype(np.float32) / 32768.0
+        audio_float32 = np.multiply(audio_int16, self._scale, dtype=np.float32, casting='unsafe')
         
         return audio_float32
 
+    def read_chunk_into(self, out: np.ndarray) -> int:
+        """
+        Reads a single chunk of audio from the microphone into a caller buffer.
+        
+        Same conversion as read_chunk(), but the normalized float32 samples are
+        written into out so a capture loop can reuse preallocated storage.
+        
+        Args:
+            out: float32 array of at least CHUNK_SIZE samples.
+        
+        Returns:
+            int: Number of samples written to the start of out. Zero-filled
+                when hardware is unavailable or on overflow.
+        """
+        if not self._pyaudio_available or self.input_stream is None:
+            time.sleep(self.CHUNK_SIZE / self.SAMPLE_RATE)
+            out[:self.CHUNK_SIZE] = 0.0
+            return self.CHUNK_SIZE
+        
+        try:
+            raw_data = self.input_stream.read(self.CHUNK_SIZE, exception_on_overflow=False)
+        except IOError as e:
+            logger.warning(f"Audio input overflow: {e}")
+            out[:self.CHUNK_SIZE] = 0.0
+            return self.CHUNK_SIZE
+        
+        audio_int16 = np.frombuffer(raw_data, dtype=np.int16)
+        n = len(audio_int16)
+        np.multiply(audio_int16, self._scale, out=out[:n], casting='unsafe')
+        return n
+
     def write_chunk(self, audio_data: Union[bytes, np.ndarray, None]) -> None:
         """
-        Plays a chunk of audio out to the speakers.
+        Queues a chunk of audio for playback on the speakers.
         
-        Accepts audio data as bytes or numpy array (float32 or int16) and writes
-        it to the output stream. Automatically converts float32 arrays to int16
-        format required by PyAudio.
+        Accepts audio data as bytes or numpy array (float32 or int16) and queues
+        it as one utterance for the output stream callback. Returns immediately;
+        once more than PLAYBACK_MAX_BACKLOG_SECONDS would be queued, the oldest
+        utterances that have not started playing are dropped whole.
         
         Args:
             audio_data: Audio data as bytes or numpy array (float32 normalized
@@ -143,20 +596,41 @@ class AudioService:
         Returns:
             None
         """
-        if not self._pyaudio_available or self.output_stream is None:
+        if not self._pyaudio_available or self.output_stream is None or audio_data is None:
             return
         
         if isinstance(audio_data, np.ndarray):
             if audio_data.dtype == np.float32:
-                audio_data = (audio_data * 32768.0).astype(np.int16)
+                samples = (audio_data * 32768.0).astype(np.int16)
             elif audio_data.dtype != np.int16:
-                audio_data = audio_data.astype(np.int16)
-            
-            audio_bytes = audio_data.tobytes()
+                samples = audio_data.astype(np.int16)
+            else:
+                samples = audio_data
         else:
-            audio_bytes = audio_data
+            # Drop a trailing odd byte rather than failing the int16 view
+            samples = np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
         
-        self.output_stream.write(audio_bytes)
+        dropped = self._playback_queue.write(samples)
+        if dropped:
+            logger.warning("Playback backlog exceeded, dropped %d samples of queued utterances", dropped)
+
+    def _playback_callback(self, in_data, frame_count, time_info, status):
+        """
+        PortAudio output callback; drains the playback queue or plays silence.
+        
+        The playback filter, when set, runs on the samples just drained.
+        
+        Returns:
+            tuple: (PCM bytes for frame_count frames, pyaudio.paContinue)
+        """
+        out = self._playback_out
+        if len(out) != frame_count:
+            out = self._playback_out = np.zeros(frame_count, dtype=np.int16)
+        n = self._playback_queue.read_into(out)
+        playback_filter = self.playback_filter
+        if n and playback_filter is not None:
+            playback_filter(out[:n])
+        return out.tobytes(), pyaudio.paContinue
 
     def close(self) -> None:
         """
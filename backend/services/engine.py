@@ -1,94 +1,151 @@
 import asyncio
+import collections
+import functools
 import logging
 import os
-import queue
 import socket
-import struct
 import threading
 import time
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+import msgpack
 import numpy as np
 
 from ..api.types import JanusMode, PacketSummaryMessage, TranscriptMessage
 from ..common import engine_state
-from ..common.protocol import JanusMode as ProtocolJanusMode, JanusPacket
-from .audio_io import AudioService
+from ..common.protocol import (
+    LENGTH_PREFIX,
+    MAX_PACKET_BYTES,
+    MODE_NAMES,
+    JanusMode as ProtocolJanusMode,
+    JanusPacket,
+    receiver_emotion,
+)
+from .audio_io import (
+    MAX_UTTERANCE_SECONDS,
+    AudioService,
+    ChunkRing,
+    PreRollBuffer,
+    UtteranceBuffer,
+)
 from .link_simulator import LinkSimulator
-from .prosody import ProsodyExtractor
-from .synthesizer import Synthesizer
-from .transcriber import Transcriber
-from .vad import VoiceActivityDetector
+from .models import get_prosody, get_synthesizer, get_transcriber, get_vad
 
 if TYPE_CHECKING:
     from types import ModuleType
 
+    from .prosody import ProsodyExtractor
+    from .synthesizer import Synthesizer
+    from .transcriber import Transcriber
+
 logger = logging.getLogger(__name__)
 
+# Capture chunks buffered between the producer thread and smart_ear_loop
+CAPTURE_RING_CHUNKS = 100
+
+# Length of the receiver's reusable synthesis buffer; longer clips are
+# rendered into their own array rather than cut
+MAX_SYNTH_SECONDS = 30
+
+# Packets allowed to wait on the 300bps link; a packet takes seconds to send,
+# so beyond this new utterances are folded into the newest waiting packet
+# rather than queued without bound
+MAX_PENDING_TRANSMISSIONS = 2
+
+_API_TO_PROTOCOL_MODE = {
+    JanusMode.SEMANTIC: ProtocolJanusMode.SEMANTIC_VOICE,
+    JanusMode.TEXT_ONLY: ProtocolJanusMode.TEXT_ONLY,
+    JanusMode.MORSE: ProtocolJanusMode.MORSE_CODE,
+}
 
-def recv_exact(sock: socket.socket, n: int) -> bytes | None:
+_PROTOCOL_TO_API_MODE = {
+    protocol_mode: api_mode for api_mode, protocol_mode in _API_TO_PROTOCOL_MODE.items()
+}
+
+# Modes that transmit without VAD gating (non-semantic payloads)
+_NON_VAD_MODES = frozenset((JanusMode.MORSE, JanusMode.TEXT_ONLY))
+
+
+async def recv_into_exact(sock: socket.socket, view: memoryview) -> bool:
     """
-    Helper function to receive exactly n bytes from a socket.
+    Fill a buffer view completely from a non-blocking socket.
     
-    Handles fragmented reads that can occur with TCP by repeatedly reading
-    until the requested number of bytes is received.
+    Awaits readiness on the running event loop and resumes short reads at the
+    current offset until the view is full, writing straight into the caller's
+    buffer.
     
     Args:
-        sock: The socket to read from.
-        n: Number of bytes to read.
+        sock: Non-blocking socket to read from.
+        view: Writable memoryview to fill; its length is the byte count read.
         
     Returns:
-        bytes | None: Exactly n bytes, or None if connection is closed
-            before all bytes are received.
+        bool: True once the view is full, False if the connection closed first.
     """
-    data = b''
-    while len(data) < n:
-        packet = sock.recv(n - len(data))
-        if not packet:
-            return None  # Connection closed
-        data += packet
-    return data
+    loop = asyncio.get_running_loop()
+    n = len(view)
+    received = 0
+    while received < n:
+        count = await loop.sock_recv_into(sock, view[received:])
+        if not count:
+            return False  # Connection closed
+        received += count
+    return True
 
 
-def playback_worker(
-    audio_service: AudioService,
-    playback_queue: queue.Queue[bytes],
-    stop_event: threading.Event,
+def _ducking_level(state: "engine_state.ControlState") -> float | None:
+    """
+    Resolve the playback gain to apply for the current control state.
+
+    Args:
+        state: Shared ControlState containing ducking configuration.
+
+    Returns:
+        float | None: Gain in [0.0, 1.0), or None when playback is unaltered.
+    """
+    if not getattr(state, "ducking_enabled", True):
+        return None
+
+    if not getattr(state, "is_talking", False):
+        return None
+
+    level = float(getattr(state, "ducking_level", 0.25))
+    # Clamp to [0.0, 1.0]
+    if level <= 0.0:
+        return 0.0
+    if level >= 1.0:
+        return None
+    return level
+
+
+def _scale_q15(
+    samples: np.ndarray,
+    level: float,
+    out: np.ndarray,
+    scratch: np.ndarray | None = None,
 ) -> None:
     """
-    Playback thread worker function.
-    
-    Continuously pulls audio bytes from queue and plays them. Prevents blocking
-    the main receiver loop by running in a separate thread.
-    
+    Scale int16 PCM by a gain below 1.0 using Q15 fixed-point arithmetic.
+
+    Avoids a float round trip: samples are multiplied by the integer gain in
+    int32, then shifted back down and narrowed to int16 in the same ufunc
+    pass. The result always fits int16 for |gain| < 1, so no saturation step
+    is needed.
+
     Args:
-        audio_service: AudioService instance for playback.
-        playback_queue: Queue containing audio bytes to play.
-        stop_event: Threading event to signal shutdown. Worker exits when
-            this event is set.
-    
+        samples: int16 PCM input.
+        level: Gain in [0.0, 1.0).
+        out: int16 destination of the same length; may be samples itself.
+        scratch: Optional int32 work buffer of at least len(samples) entries.
+
     Returns:
         None
     """
-    while not stop_event.is_set():
-        try:
-            try:
-                audio_bytes = playback_queue.get(timeout=0.1)
-            except queue.Empty:
-                continue
-            
-            if audio_bytes:
-                from ..common import engine_state as _engine_state  # local import to avoid cycles
-                audio_bytes = apply_ducking_if_needed(audio_bytes, _engine_state.control_state)
-                audio_service.write_chunk(audio_bytes)
-            
-            playback_queue.task_done()
-            
-        except Exception as e:
-            logger.error(f"Playback error: {e}")
-            playback_queue.task_done()
+    n = samples.size
+    if scratch is None or scratch.size < n:
+        scratch = np.empty(n, dtype=np.int32)
+    work = scratch[:n]
+    np.multiply(samples, int(level * 32768), out=work, dtype=np.int32)
+    np.right_shift(work, 15, out=out, casting='unsafe')
 
 
 def apply_ducking_if_needed(audio_bytes: bytes, state: "engine_state.ControlState") -> bytes:
@@ -107,17 +164,8 @@ def apply_ducking_if_needed(audio_bytes: bytes, state: "engine_state.ControlStat
         bytes: Possibly gain-reduced PCM audio.
     """
     try:
-        if not getattr(state, "ducking_enabled", True):
-            return audio_bytes
-
-        if not getattr(state, "is_talking", False):
-            return audio_bytes
-
-        level = float(getattr(state, "ducking_level", 0.25))
-        # Clamp to [0.0, 1.0]
-        if level <= 0.0:
-            level = 0.0
-        elif level >= 1.0:
+        level = _ducking_level(state)
+        if level is None:
             return audio_bytes
 
         if not audio_bytes:
@@ -127,28 +175,54 @@ def apply_ducking_if_needed(audio_bytes: bytes, state: "engine_state.ControlStat
         if samples.size == 0:
             return audio_bytes
 
-        scaled = np.clip(samples.astype(np.float32) * level, -32768, 32767).astype(np.int16)
+        scaled = np.empty_like(samples)
+        _scale_q15(samples, level, scaled)
         return scaled.tobytes()
     except Exception as e:
         logger.error(f"Error applying ducking: {e}")
         return audio_bytes
 
 
-def receiver_loop(
-    audio_service: AudioService,
-    stop_event: threading.Event,
-    event_loop: asyncio.AbstractEventLoop,
+def apply_ducking_in_place(
+    samples: np.ndarray,
+    state: "engine_state.ControlState",
+    scratch: np.ndarray | None = None,
 ) -> None:
+    """
+    Apply audio ducking directly to an int16 sample buffer.
+
+    Same policy as apply_ducking_if_needed, for callers that own a reusable
+    playback buffer and want to avoid a bytes round trip.
+
+    Args:
+        samples: int16 PCM samples, modified in place.
+        state: Shared ControlState containing ducking configuration.
+        scratch: Optional preallocated int32 work buffer reused across calls.
+
+    Returns:
+        None
+    """
+    try:
+        level = _ducking_level(state)
+        if level is None or samples.size == 0:
+            return
+        _scale_q15(samples, level, samples, scratch)
+    except Exception as e:
+        logger.error(f"Error applying ducking: {e}")
+
+
+async def receiver_loop(audio_service: AudioService) -> None:
     """
     Receiver loop for full-duplex audio.
     
-    Listens for TCP connections, receives JanusPackets, synthesizes audio, and plays it.
-    Runs in a separate thread to avoid blocking the main event loop.
+    Listens for TCP connections, receives JanusPackets, synthesizes audio, and queues
+    it on the AudioService playback queue. Runs as a task on the main event loop:
+    socket reads await readiness instead of occupying a thread, frontend events
+    are enqueued directly, and shutdown is immediate on cancellation. Synthesis,
+    which blocks on the network or CPU, is offloaded to a worker thread.
     
     Args:
         audio_service: Shared AudioService instance for playback.
-        stop_event: Threading event to signal shutdown. Loop exits when set.
-        event_loop: asyncio event loop for emitting events to frontend.
     
     Returns:
         None
@@ -162,154 +236,154 @@ def receiver_loop(
     reference_audio_path = os.getenv("REFERENCE_AUDIO_PATH", None)
     
     try:
-        synthesizer = Synthesizer(api_key=api_key, reference_audio_path=reference_audio_path)
+        synthesizer = get_synthesizer(api_key, reference_audio_path)
     except Exception as e:
         logger.error(f"Failed to initialize Synthesizer: {e}")
         return
     
     listen_sock = None
-    sock = None
     try:
         listen_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         listen_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         listen_sock.bind(('0.0.0.0', receiver_port))
         listen_sock.listen(1)
+        listen_sock.setblocking(False)
         logger.info(f"Listening for Transmissions on TCP port {receiver_port}...")
-        sock, addr = listen_sock.accept()
-        logger.info(f"Connection established from {addr}")
-        sock.settimeout(1.0)
     except Exception as e:
         logger.error(f"Failed to set up TCP listener: {e}")
         if listen_sock:
             listen_sock.close()
         return
     
-    playback_queue = queue.Queue(maxsize=100)
-    playback_stop_event = threading.Event()
-    
-    playback_thread = threading.Thread(
-        target=playback_worker,
-        args=(audio_service, playback_queue, playback_stop_event),
-        daemon=True
+    loop = asyncio.get_running_loop()
+    synth_out = np.empty(MAX_SYNTH_SECONDS * audio_service.SAMPLE_RATE, dtype=np.int16)
+    # Duck in the output callback so the gain follows the talking flag while
+    # audio plays, not as it was when the utterance was queued
+    audio_service.playback_filter = functools.partial(
+        apply_ducking_in_place,
+        state=engine_state.control_state,
+        scratch=np.empty(audio_service.CHUNK_SIZE, dtype=np.int32),
     )
-    playback_thread.start()
 
     try:
-        while not stop_event.is_set():
+        # Serve one sender at a time; a closed connection returns to accept
+        while True:
+            sock, addr = await loop.sock_accept(listen_sock)
+            logger.info(f"Connection established from {addr}")
             try:
-                try:
-                    length_bytes = recv_exact(sock, 4)
-                except socket.timeout:
-                    continue
-                
-                if length_bytes is None:
-                    logger.info("Connection closed by sender")
-                    break
-                
-                payload_length = struct.unpack('>I', length_bytes)[0]
-                
-                try:
-                    data = recv_exact(sock, payload_length)
-                except socket.timeout:
-                    continue
-                
-                if data is None:
-                    logger.info("Connection closed while reading packet")
-                    break
-                try:
-                    packet = JanusPacket.deserialize(data)
-                except Exception as e:
-                    logger.error(f"Corrupt packet received: {e}")
-                    continue
-
-                try:
-                    transcript_queue = engine_state.get_transcript_queue()
-                    packet_queue = engine_state.get_packet_queue()
-                    
-                    api_mode = map_protocol_mode_to_api_mode(packet.mode)
-                    
-                    prosody = packet.prosody or {}
-                    avg_pitch_hz = prosody.get('avg_pitch_hz') if isinstance(prosody.get('avg_pitch_hz'), (int, float)) else None
-                    avg_energy = prosody.get('avg_energy') if isinstance(prosody.get('avg_energy'), (int, float)) else None
-                    
-                    if packet.override_emotion != "Auto":
-                        emotion_tag = packet.override_emotion
-                    else:
-                        prosody = packet.prosody
-                        pitch = prosody.get('pitch', 'Normal')
-                        energy = prosody.get('energy', 'Normal')
-                        
-                        if pitch == 'High' and energy == 'Loud':
-                            emotion_tag = 'Excited'
-                        elif pitch == 'High' and energy == 'Normal':
-                            emotion_tag = 'Joyful'
-                        elif pitch == 'Low' and energy == 'Loud':
-                            emotion_tag = 'Panicked'
-                        elif pitch == 'Low' and energy in ('Quiet', 'Low'):
-                            emotion_tag = 'Serious'
-                        else:
-                            emotion_tag = 'Neutral'
-
-                    asyncio.run_coroutine_threadsafe(
-                        _emit_events(
-                            text=packet.text,
-                            avg_pitch_hz=avg_pitch_hz,
-                            avg_energy=avg_energy,
-                            mode=api_mode,
-                            transcript_queue=transcript_queue,
-                            packet_queue=packet_queue,
-                            emotion=emotion_tag,
-                        ),
-                        event_loop
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to emit events to frontend: {e}")
-                
-                mode_names = {
-                    ProtocolJanusMode.SEMANTIC_VOICE: "Semantic Voice",
-                    ProtocolJanusMode.TEXT_ONLY: "Text Only",
-                    ProtocolJanusMode.MORSE_CODE: "Morse Code"
-                }
-                mode_name = mode_names.get(packet.mode, "Unknown")
-                
-                logger.info(f"[RECEIVED] [{mode_name}] '{packet.text}'")
-                logger.debug(f"   Meta: Energy={packet.prosody.get('energy', 'N/A')}, "
-                      f"Pitch={packet.prosody.get('pitch', 'N/A')} -> Prompt: [{emotion_tag}]")
-
-                try:
-                    audio_bytes = synthesizer.synthesize(packet)
-                except Exception as e:
-                    logger.error(f"Synthesis error: {e}")
-                    continue
-
-                try:
-                    playback_queue.put(audio_bytes, timeout=0.1)
-                except queue.Full:
-                    logger.warning("Warning: Playback queue full, skipping audio chunk")
-
-            except socket.timeout:
-                continue
+                # Notice a sender that vanished without closing the connection
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                sock.setblocking(False)
+                await _serve_connection(sock, audio_service, synthesizer, synth_out)
             except Exception as e:
                 logger.error(f"Receiver socket error: {e}")
-                break
+            finally:
+                sock.close()
     
-    finally:
+    except asyncio.CancelledError:
         logger.info("Shutting down receiver loop...")
-        playback_stop_event.set()
-        playback_thread.join(timeout=2)
+        raise
+    finally:
+        audio_service.playback_filter = None
+        listen_sock.close()
+        logger.info("Receiver loop shutdown complete.")
+
+
+async def _serve_connection(
+    sock: socket.socket,
+    audio_service: AudioService,
+    synthesizer: "Synthesizer",
+    synth_out: np.ndarray,
+) -> None:
+    """
+    Receive, announce and play packets from one sender until it disconnects.
+    
+    Args:
+        sock: Connected non-blocking TCP socket.
+        audio_service: Shared AudioService instance for playback.
+        synthesizer: Synthesizer used to render each packet.
+        synth_out: Reusable int16 buffer that receives synthesized PCM.
+    
+    Returns:
+        None
+    """
+    header_view = memoryview(bytearray(4))
+    recv_buffer = bytearray(MAX_PACKET_BYTES)
+
+    while True:
+        if not await recv_into_exact(sock, header_view):
+            logger.info("Connection closed by sender")
+            return
         
-        if sock:
-            try:
-                sock.close()
-            except Exception:
-                pass
-        if listen_sock:
-            try:
-                listen_sock.close()
-            except Exception:
-                pass
+        payload_length = LENGTH_PREFIX.unpack(header_view)[0]
         
-        logger.info("Receiver loop shutdown complete.")
+        # The stream cannot be resynchronized after a bad length prefix, and
+        # honoring it could mean a multi-GB allocation, so drop the sender
+        if payload_length > MAX_PACKET_BYTES:
+            logger.warning(
+                "Packet length %d exceeds %d bytes, closing connection",
+                payload_length, MAX_PACKET_BYTES,
+            )
+            return
+        payload_view = memoryview(recv_buffer)[:payload_length]
+        
+        if not await recv_into_exact(sock, payload_view):
+            logger.info("Connection closed while reading packet")
+            return
+        
+        try:
+            # msgpack decodes straight from the receive buffer, no bytes copy
+            packet = JanusPacket.deserialize(payload_view)
+        except Exception as e:
+            logger.error(f"Corrupt packet received: {e}")
+            continue
+
+        try:
+            transcript_queue = engine_state.get_transcript_queue()
+            packet_queue = engine_state.get_packet_queue()
+            
+            api_mode = map_protocol_mode_to_api_mode(packet.mode)
+            
+            # from_dict already normalized these to float | None
+            prosody = packet.prosody
+            avg_pitch_hz = prosody.get('avg_pitch_hz')
+            avg_energy = prosody.get('avg_energy')
+            
+            if packet.override_emotion != "Auto":
+                emotion_tag = packet.override_emotion
+            else:
+                emotion_tag = receiver_emotion(prosody)
+
+            transcript_msg, packet_msg = _build_events(
+                text=packet.text,
+                avg_pitch_hz=avg_pitch_hz,
+                avg_energy=avg_energy,
+                mode=api_mode,
+                emotion=emotion_tag,
+                payload_bytes=payload_length,
+            )
+            _enqueue_event(transcript_queue, transcript_msg)
+            _enqueue_event(packet_queue, packet_msg)
+        except Exception as e:
+            logger.error(f"Failed to emit events to frontend: {e}")
+        
+        mode_name = MODE_NAMES.get(packet.mode, "Unknown")
+        
+        logger.info("[RECEIVED] [%s] '%s'", mode_name, packet.text)
+        logger.debug(
+            "   Meta: Energy=%s, Pitch=%s -> Prompt: [%s]",
+            packet.prosody.get('energy', 'N/A'), packet.prosody.get('pitch', 'N/A'), emotion_tag,
+        )
+
+        try:
+            samples = await asyncio.to_thread(synthesizer.synthesize_into, packet, synth_out)
+        except Exception as e:
+            logger.error(f"Synthesis error: {e}")
+            continue
+
+        # write_chunk copies the samples, so synth_out is free for the next packet
+        if len(samples):
+            audio_service.write_chunk(samples)
 
 
 def map_api_mode_to_protocol_mode(api_mode: JanusMode) -> ProtocolJanusMode:
@@ -322,12 +396,7 @@ def map_api_mode_to_protocol_mode(api_mode: JanusMode) -> ProtocolJanusMode:
     Returns:
         ProtocolJanusMode: JanusMode from common.protocol (int enum)
     """
-    mapping = {
-        JanusMode.SEMANTIC: ProtocolJanusMode.SEMANTIC_VOICE,
-        JanusMode.TEXT_ONLY: ProtocolJanusMode.TEXT_ONLY,
-        JanusMode.MORSE: ProtocolJanusMode.MORSE_CODE,
-    }
-    return mapping.get(api_mode, ProtocolJanusMode.SEMANTIC_VOICE)
+    return _API_TO_PROTOCOL_MODE.get(api_mode, ProtocolJanusMode.SEMANTIC_VOICE)
 
 
 def map_protocol_mode_to_api_mode(protocol_mode: ProtocolJanusMode) -> JanusMode:
@@ -340,40 +409,38 @@ def map_protocol_mode_to_api_mode(protocol_mode: ProtocolJanusMode) -> JanusMode
     Returns:
         JanusMode: JanusMode from api.types (string enum)
     """
-    mapping = {
-        ProtocolJanusMode.SEMANTIC_VOICE: JanusMode.SEMANTIC,
-        ProtocolJanusMode.TEXT_ONLY: JanusMode.TEXT_ONLY,
-        ProtocolJanusMode.MORSE_CODE: JanusMode.MORSE,
-    }
-    return mapping.get(protocol_mode, JanusMode.SEMANTIC)
+    return _PROTOCOL_TO_API_MODE.get(protocol_mode, JanusMode.SEMANTIC)
 
 
 def audio_producer(
     audio_service: AudioService,
-    audio_queue: queue.Queue[np.ndarray],
+    audio_ring: ChunkRing,
     stop_event: threading.Event,
 ) -> None:
     """
     Audio producer thread worker function.
     
-    Continuously reads audio chunks from the audio service and places them
-    in the queue for processing. Runs until stop_event is set.
+    Continuously reads audio chunks from the audio service directly into the
+    capture ring's preallocated slots for processing. Runs until stop_event is
+    set. Chunks are read and discarded while the ring is full so the input
+    stream keeps draining.
     
     Args:
         audio_service: AudioService instance for reading audio input.
-        audio_queue: Queue for storing audio chunks (numpy arrays).
+        audio_ring: Single-producer/single-consumer ring of capture chunks.
         stop_event: Threading event to signal shutdown. Producer exits when set.
     
     Returns:
         None
     """
+    overflow = np.empty(audio_service.CHUNK_SIZE, dtype=np.float32)
     while not stop_event.is_set():
         try:
-            chunk = audio_service.read_chunk()
-            try:
-                audio_queue.put(chunk, timeout=0.1)
-            except queue.Full:
-                pass
+            slot = audio_ring.acquire()
+            if slot is None:
+                audio_service.read_chunk_into(overflow)
+                continue
+            audio_ring.commit(audio_service.read_chunk_into(slot))
         except Exception as e:
             logger.error(f"Error in audio producer: {e}")
             time.sleep(0.1)
@@ -391,7 +458,8 @@ async def smart_ear_loop(
     Processes audio input using VAD, transcription, and prosody extraction.
     Responds to control state changes from the frontend and emits transcript
     and packet summary events. Runs asynchronously to avoid blocking the
-    main event loop.
+    main event loop: only single-chunk VAD runs inline, while batched VAD
+    catch-up, transcription and prosody run on worker threads.
     
     Args:
         control_state: Shared control state updated by WebSocket messages.
@@ -404,13 +472,10 @@ async def smart_ear_loop(
     """
     logger.info("Initializing Smart Ear services...")
 
-    loop = asyncio.get_running_loop()
-
     try:
-        executor = ThreadPoolExecutor(max_workers=2)
-        vad_model = VoiceActivityDetector()
-        transcriber = Transcriber()
-        prosody_tool = ProsodyExtractor()
+        vad_model = get_vad()
+        transcriber = get_transcriber()
+        prosody_tool = get_prosody()
 
         target_ip = os.getenv("TARGET_IP", "127.0.0.1")
         target_port = int(os.getenv("TARGET_PORT", "5005"))
@@ -425,183 +490,238 @@ async def smart_ear_loop(
         logger.error(f"Failed to initialize Smart Ear services: {e}")
         return
 
-    audio_queue = queue.Queue(maxsize=100)
-    stop_event = threading.Event()
-
-    producer_thread = threading.Thread(
-        target=audio_producer,
-        args=(audio_service, audio_queue, stop_event),
-        daemon=True,
+    # The producer wakes this task through the loop instead of a worker thread
+    # blocking on the ring, so an idle stream costs no polling
+    loop = asyncio.get_running_loop()
+    chunks_ready = asyncio.Event()
+    audio_ring = ChunkRing(
+        CAPTURE_RING_CHUNKS,
+        audio_service.CHUNK_SIZE,
+        on_commit=functools.partial(loop.call_soon_threadsafe, chunks_ready.set),
     )
-    producer_thread.start()
+    chunk_batch = np.empty((CAPTURE_RING_CHUNKS, audio_service.CHUNK_SIZE), dtype=np.float32)
+    stop_event = threading.Event()
 
-    audio_buffer = []
-    pre_roll_buffer = deque(maxlen=10)
+    # Prefer the PortAudio input callback filling the ring directly; the
+    # polling thread only covers mock mode where there is no input stream
+    producer_thread = None
+    if not audio_service.start_capture(audio_ring):
+        producer_thread = threading.Thread(
+            target=audio_producer,
+            args=(audio_service, audio_ring, stop_event),
+            daemon=True,
+        )
+        producer_thread.start()
+
+    audio_buffer = UtteranceBuffer(MAX_UTTERANCE_SECONDS * audio_service.SAMPLE_RATE)
+    pre_roll_buffer = PreRollBuffer(10, audio_service.CHUNK_SIZE)
     silence_counter = 0
     SILENCE_THRESHOLD_CHUNKS = 15  # ~500ms
+    # Every packet is serialized on this loop, so one Packer can be reused
+    packet_packer = msgpack.Packer(use_bin_type=True)
+    # Packets waiting on the link, sent one at a time by a single drain task
+    outbox: "collections.deque[JanusPacket]" = collections.deque()
+    outbox_ready = asyncio.Event()
+    drain_task = asyncio.create_task(
+        _drain_outbox(link_simulator, outbox, outbox_ready, packet_packer, packet_queue)
+    )
     previous_hold_state = False
 
     try:
         while True:
-            try:
-                chunk = audio_queue.get_nowait()
-            except queue.Empty:
-                await asyncio.sleep(0.01)
+            if not len(audio_ring):
+                chunks_ready.clear()
+                # Re-check after clearing so a commit in between is not missed
+                if not len(audio_ring):
+                    await chunks_ready.wait()
                 continue
 
-            trigger_processing = False
+            # Drain every pending chunk before yielding back to the event loop
+            chunks = []
+            while len(chunks) < CAPTURE_RING_CHUNKS:
+                chunk = audio_ring.pop_into(chunk_batch[len(chunks)])
+                if chunk is None:
+                    break
+                chunks.append(chunk)
 
+            # Control state only changes while this task is suspended, so it is
+            # read once per batch and again after each await below
             is_streaming_mode = control_state.is_streaming
             is_recording_hold = control_state.is_recording
+            # Bypass VAD gating for Morse and Text modes to avoid blocking non-semantic transmissions
+            is_non_vad_mode = control_state.mode in _NON_VAD_MODES
+
+            # VAD runs here rather than where ChunkRing.commit happens: the
+            # producer is usually the PortAudio input callback, which must
+            # return within the chunk period and should never run model code.
+            # In steady state one chunk is pending and goes through the scalar
+            # is_speech below, inline (~0.2 ms for Silero on CPU, well under
+            # the 32 ms chunk period). Only when the loop has fallen behind is
+            # the backlog classified in one batched call on a worker thread
+            # (~0.8 ms for 8 chunks), so a long catch-up never stalls WebSocket
+            # traffic. chunk_batch is only refilled after the flags come back.
+            speech_flags = None
+            if (
+                len(chunks) > 1
+                and is_streaming_mode
+                and not is_recording_hold
+                and not is_non_vad_mode
+                and all(len(c) == audio_service.CHUNK_SIZE for c in chunks)
+            ):
+                speech_flags = await asyncio.to_thread(
+                    vad_model.is_speech_batch, chunk_batch[:len(chunks)]
+                )
 
-            # Push-to-talk / recording-hold: user is actively talking
-            if is_recording_hold:
-                control_state.is_talking = True
-                audio_buffer.append(chunk)
-                previous_hold_state = True
-                continue
+            for index, chunk in enumerate(chunks):
+                trigger_processing = False
 
-            # Transition: PTT just released -> process buffered audio and stop talking
-            if previous_hold_state and not is_recording_hold:
-                logger.info("PTT Released - triggering processing.")
-                trigger_processing = True
-                previous_hold_state = False
-                control_state.is_talking = False
-
-            elif is_streaming_mode:
-                # Bypass VAD gating for Morse and Text modes to avoid blocking non-semantic transmissions
-                is_non_vad_mode = control_state.mode in [JanusMode.MORSE, JanusMode.TEXT_ONLY]
-                is_speech = vad_model.is_speech(chunk) or is_non_vad_mode
-
-                if is_speech:
-                    if len(audio_buffer) == 0:
-                        logger.info(f"Transmission started (mode={control_state.mode}, speech={not is_non_vad_mode})")
-                        audio_buffer.extend(list(pre_roll_buffer))
-                    
-                    control_state.is_talking = True
+                # Push-to-talk / recording-hold: user is actively talking
+                if is_recording_hold:
+                    _set_talking(control_state, True)
                     audio_buffer.append(chunk)
-                    silence_counter = 0
-                else:
-                    silence_counter += 1
-                    if len(audio_buffer) > 0:
-                        audio_buffer.append(chunk)
-                    else:
-                        pre_roll_buffer.append(chunk)
+                    previous_hold_state = True
+                    continue
 
-                    if silence_counter > SILENCE_THRESHOLD_CHUNKS:
-                        trigger_processing = True
-                        control_state.is_talking = False
+                # Transition: PTT just released -> process buffered audio and stop talking
+                if previous_hold_state and not is_recording_hold:
+                    logger.info("PTT Released - triggering processing.")
+                    trigger_processing = True
+                    previous_hold_state = False
+                    _set_talking(control_state, False)
+
+                elif is_streaming_mode:
+                    # Non-VAD modes never consult the model, so skip its forward pass
+                    if is_non_vad_mode:
+                        is_speech = True
+                    elif speech_flags is not None:
+                        is_speech = bool(speech_flags[index])
+                    else:
+                        is_speech = vad_model.is_speech(chunk)
 
-            else:
-                # Neither recording nor streaming -> ensure talking flag is cleared
-                control_state.is_talking = False
+                    if is_speech:
+                        if not audio_buffer:
+                            logger.info("Transmission started (mode=%s, speech=%s)", control_state.mode, not is_non_vad_mode)
+                            audio_buffer.extend(pre_roll_buffer)
+                    
+                        _set_talking(control_state, True)
+                        audio_buffer.append(chunk)
+                        silence_counter = 0
+                    else:
+                        silence_counter += 1
+                        if audio_buffer:
+                            audio_buffer.append(chunk)
+                        else:
+                            pre_roll_buffer.append(chunk)
 
-            if trigger_processing and len(audio_buffer) > 0:
-                combined_audio = np.concatenate(audio_buffer)
-                audio_buffer = []
-                silence_counter = 0
+                        if silence_counter > SILENCE_THRESHOLD_CHUNKS:
+                            trigger_processing = True
+                            _set_talking(control_state, False)
 
-                if len(combined_audio) < 1536 * 6:
-                    logger.info(f"Skipping short audio buffer ({len(combined_audio)} samples)")
-                    continue
+                else:
+                    # Neither recording nor streaming -> ensure talking flag is cleared
+                    _set_talking(control_state, False)
 
-                duration_sec = len(combined_audio) / audio_service.SAMPLE_RATE
-                logger.info(f"Processing audio buffer ({len(combined_audio)} samples, {duration_sec:.2f}s)...")
-                def process_audio_blocking(audio_data):
-                    t_text = ""
-                    t_meta = {}
-                    try:
-                        t_text = transcriber.transcribe_buffer(audio_data)
-                    except Exception as e:
-                        logger.error(f"Transcribe error: {e}")
-
-                    try:
-                        t_meta = prosody_tool.analyze_buffer(audio_data)
-                    except Exception as e:
-                        logger.error(f"Prosody error: {e}")
-                        t_meta = {
-                            "energy": "Normal",
-                            "pitch": "Normal",
-                        }
-
-                    return t_text, t_meta
-
-                text, meta = await loop.run_in_executor(
-                    executor, process_audio_blocking, combined_audio
-                )
+                if trigger_processing and audio_buffer:
+                    combined_audio = audio_buffer.view()
+                    audio_buffer.clear()
+                    silence_counter = 0
 
-                audio_buffer = []
-                silence_counter = 0
+                    if len(combined_audio) < 1536 * 6:
+                        logger.info("Skipping short audio buffer (%d samples)", len(combined_audio))
+                        continue
+
+                    duration_sec = len(combined_audio) / audio_service.SAMPLE_RATE
+                    logger.info("Processing audio buffer (%d samples, %.2fs)...", len(combined_audio), duration_sec)
+                    # Transcription and prosody only read the utterance, so they
+                    # run side by side and the wait is the slower of the two
+                    text, meta = await asyncio.gather(
+                        asyncio.to_thread(_transcribe_or_empty, transcriber, combined_audio),
+                        asyncio.to_thread(_prosody_or_default, prosody_tool, combined_audio),
+                    )
 
-                if text.strip():
-                    logger.info(f"Captured: '{text}' | Tone: {meta}")
+                    if text.strip():
+                        logger.info("Captured: '%s' | Tone: %s", text, meta)
 
-                    def transmit_packet_blocking():
                         try:
-                            protocol_mode = map_api_mode_to_protocol_mode(control_state.mode)
                             packet = JanusPacket(
                                 text=text,
-                                mode=protocol_mode,
+                                mode=map_api_mode_to_protocol_mode(control_state.mode),
                                 prosody=meta,
                                 override_emotion=control_state.emotion_override
                             )
-                            link_simulator.transmit(packet.serialize())
                         except Exception as e:
                             logger.error(f"Transmission Error: {e}")
-
-                    await loop.run_in_executor(executor, transmit_packet_blocking)
-
-                    avg_pitch_hz = None
-                    avg_energy = None
-                    
-                    await _emit_events(
-                        text=text,
-                        avg_pitch_hz=avg_pitch_hz,
-                        avg_energy=avg_energy,
-                        mode=control_state.mode,
-                        transcript_queue=transcript_queue,
-                        packet_queue=packet_queue,
-                        emotion=str(control_state.emotion_override),
-                    )
+                            packet = None
+
+                        transcript_msg, _ = _build_events(
+                            text=text,
+                            avg_pitch_hz=None,
+                            avg_energy=None,
+                            mode=control_state.mode,
+                        )
+                        _enqueue_event(transcript_queue, transcript_msg)
+
+                        if packet is not None:
+                            # The simulated link takes seconds per packet; capture
+                            # keeps running while the outbox drains in the background
+                            _queue_packet(outbox, packet)
+                            outbox_ready.set()
+
+                    # The frontend may have toggled state while processing ran
+                    is_streaming_mode = control_state.is_streaming
+                    is_recording_hold = control_state.is_recording
+                    is_non_vad_mode = control_state.mode in _NON_VAD_MODES
+
+            # Yield once per drained batch so WebSocket handlers stay responsive
+            await asyncio.sleep(0)
 
     except asyncio.CancelledError:
         logger.info("Smart Ear loop cancelled. Cleaning up...")
     finally:
         stop_event.set()
-        producer_thread.join(timeout=2)
+        audio_service.stop_capture()
+        if producer_thread is not None:
+            producer_thread.join(timeout=2)
+        if 'drain_task' in locals():
+            drain_task.cancel()
+            # Let a cancelled send unwind before the socket under it is closed
+            await asyncio.gather(drain_task, return_exceptions=True)
         if 'link_simulator' in locals():
             link_simulator.close()
-        executor.shutdown(wait=False)
         logger.info("Smart Ear stopped.")
 
 
-async def _emit_events(
+def _build_events(
     text: str,
     avg_pitch_hz: float | None,
     avg_energy: float | None,
     mode: JanusMode,
-    transcript_queue: "asyncio.Queue[TranscriptMessage]",
-    packet_queue: "asyncio.Queue[PacketSummaryMessage]",
     emotion: str | None = None,
     snippet_length: int = 60,
-) -> None:
+    payload_bytes: int | None = None,
+) -> tuple[TranscriptMessage, PacketSummaryMessage]:
     """
-    Emit transcript and packet summary events to frontend queues.
+    Build the transcript and packet summary messages for one utterance.
+    
+    Fields come from the engine itself rather than from a client, so the
+    messages are assembled with model_construct and skip Pydantic validation.
     
     Args:
         text: Transcribed text content.
         avg_pitch_hz: Average pitch in Hz, or None if not available.
         avg_energy: Average energy level, or None if not available.
         mode: JanusMode transmission mode.
-        transcript_queue: Async queue for transcript messages.
-        packet_queue: Async queue for packet summary messages.
+        emotion: Emotion tag shown alongside the packet, if any.
+        snippet_length: Maximum number of characters kept in the packet snippet.
+        payload_bytes: Serialized packet size when known; otherwise it is
+            estimated from the text.
     
     Returns:
-        None
+        tuple[TranscriptMessage, PacketSummaryMessage]: Messages ready to enqueue.
     """
-    now_ms = int(time.time() * 1000)
+    now_ms = time.time_ns() // 1_000_000
 
-    transcript_msg = TranscriptMessage(
+    transcript_msg = TranscriptMessage.model_construct(
         type="transcript",
         text=text,
         start_ms=None,
@@ -609,19 +729,204 @@ async def _emit_events(
         avg_pitch_hz=avg_pitch_hz,
         avg_energy=avg_energy,
     )
-    await transcript_queue.put(transcript_msg)
 
-    # Packet estimate
-    approximate_bytes = len(text.encode("utf-8")) + 16
+    # The wire size is the same for every mode (Morse is rendered by the
+    # receiver), so report it exactly when the caller has the payload
+    if payload_bytes is None:
+        # ASCII text needs no encode to know its UTF-8 length
+        payload_bytes = (len(text) if text.isascii() else len(text.encode("utf-8"))) + 16
 
     snippet = text[:snippet_length].strip()
 
-    packet_msg = PacketSummaryMessage(
+    packet_msg = PacketSummaryMessage.model_construct(
         type="packet_summary",
-        bytes=approximate_bytes,
+        bytes=payload_bytes,
         mode=mode,
         created_at_ms=now_ms,
         emotion=emotion,
         snippet=snippet if snippet else None,
     )
-    await packet_queue.put(packet_msg)
+    return transcript_msg, packet_msg
+
+
+def _transcribe_or_empty(transcriber: "Transcriber", audio_data: np.ndarray) -> str:
+    """
+    Transcribe an utterance, logging failures instead of raising.
+    
+    Args:
+        transcriber: Whisper transcriber.
+        audio_data: float32 utterance samples.
+    
+    Returns:
+        str: Transcribed text, or an empty string on error.
+    """
+    try:
+        return transcriber.transcribe_buffer(audio_data)
+    except Exception as e:
+        logger.error(f"Transcribe error: {e}")
+        return ""
+
+
+def _prosody_or_default(prosody_tool: "ProsodyExtractor", audio_data: np.ndarray) -> dict:
+    """
+    Extract prosody tags for an utterance, falling back to neutral tags on error.
+    
+    Args:
+        prosody_tool: Aubio prosody extractor.
+        audio_data: float32 utterance samples.
+    
+    Returns:
+        dict: Prosody metadata with at least 'energy' and 'pitch'.
+    """
+    try:
+        return prosody_tool.analyze_buffer(audio_data)
+    except Exception as e:
+        logger.error(f"Prosody error: {e}")
+        return {
+            "energy": "Normal",
+            "pitch": "Normal",
+        }
+
+
+def _set_talking(control_state: engine_state.ControlState, value: bool) -> None:
+    """
+    Update the talking flag only when it changes.
+    
+    The capture loop reports talking state for every chunk; assigning through
+    the Pydantic model's __setattr__ each time is far costlier than the read.
+    
+    Args:
+        control_state: Shared control state.
+        value: Whether the local user is currently talking.
+    
+    Returns:
+        None
+    """
+    if control_state.is_talking != value:
+        control_state.is_talking = value
+
+
+def _enqueue_event(event_queue: asyncio.Queue, event: object) -> None:
+    """
+    Enqueue a frontend event without waiting, evicting the oldest if full.
+    
+    Must be called on the event loop. Emits never block on, or grow without
+    bound behind, a slow WebSocket client, and a client that catches up sees
+    the most recent events rather than stale ones.
+    
+    Args:
+        event_queue: Destination async queue.
+        event: Message to enqueue.
+    
+    Returns:
+        None
+    """
+    try:
+        event_queue.put_nowait(event)
+    except asyncio.QueueFull:
+        # Nothing else runs between these calls on the loop, so the freed
+        # slot is still available for the new event
+        event_queue.get_nowait()
+        event_queue.put_nowait(event)
+        logger.warning("Event queue full, dropped oldest frontend event")
+
+
+def _queue_packet(outbox: "collections.deque[JanusPacket]", packet: JanusPacket) -> None:
+    """
+    Add a packet to the link outbox without letting the backlog grow unbounded.
+    
+    Once MAX_PENDING_TRANSMISSIONS packets are waiting, the new utterance's
+    text is appended to the newest waiting packet instead, so nothing the user
+    said is lost and the backlog stays bounded. The merged packet keeps the
+    mode and tone it was queued with.
+    
+    Args:
+        outbox: Packets waiting on the link, oldest first.
+        packet: Packet for the utterance just transcribed.
+    
+    Returns:
+        None
+    """
+    if len(outbox) < MAX_PENDING_TRANSMISSIONS:
+        outbox.append(packet)
+        return
+    newest = outbox[-1]
+    newest.text = f"{newest.text} {packet.text}"
+    logger.warning(
+        "Link backlog full (%d packets pending), merged utterance into the last queued packet",
+        len(outbox),
+    )
+
+
+async def _drain_outbox(
+    link_simulator: LinkSimulator,
+    outbox: "collections.deque[JanusPacket]",
+    outbox_ready: asyncio.Event,
+    packet_packer: msgpack.Packer,
+    packet_queue: "asyncio.Queue[PacketSummaryMessage]",
+) -> None:
+    """
+    Send queued packets over the simulated link in order until cancelled.
+    
+    Packets are serialized when they leave the outbox, so the packet summary
+    reports the bytes actually sent, including any merged text.
+    
+    Args:
+        link_simulator: Link the packets are sent over.
+        outbox: Packets waiting on the link, oldest first.
+        outbox_ready: Set whenever a packet is queued.
+        packet_packer: Packer reused for every payload on this loop.
+        packet_queue: Async queue for packet summary messages.
+    
+    Returns:
+        None
+    """
+    while True:
+        if not outbox:
+            outbox_ready.clear()
+            await outbox_ready.wait()
+            continue
+
+        packet = outbox.popleft()
+        try:
+            payload = packet.serialize(packet_packer)
+        except Exception as e:
+            logger.error(f"Transmission Error: {e}")
+            continue
+
+        _, packet_msg = _build_events(
+            text=packet.text,
+            avg_pitch_hz=None,
+            avg_energy=None,
+            mode=map_protocol_mode_to_api_mode(packet.mode),
+            emotion=str(packet.override_emotion),
+            payload_bytes=len(payload),
+        )
+        await _transmit_and_report(link_simulator, payload, packet_msg, packet_queue)
+
+
+async def _transmit_and_report(
+    link_simulator: LinkSimulator,
+    payload: bytes,
+    packet_msg: PacketSummaryMessage,
+    packet_queue: "asyncio.Queue[PacketSummaryMessage]",
+) -> None:
+    """
+    Send a packet over the simulated link, then report it to the frontend.
+    
+    The packet summary is only enqueued once the payload has actually been
+    handed to the socket, so the UI never shows a packet that did not leave.
+    
+    Args:
+        link_simulator: Link the payload is sent over.
+        payload: Serialized JanusPacket.
+        packet_msg: Summary to emit after a successful send.
+        packet_queue: Async queue for packet summary messages.
+    
+    Returns:
+        None
+    """
+    if await link_simulator.transmit_async(payload):
+        _enqueue_event(packet_queue, packet_msg)
+    else:
+        logger.warning("Packet was not sent; summary withheld from the frontend")
@@ -6,12 +6,15 @@ Purpose: Simulates a constrained 300bps network connection for demonstration pur
          to avoid interfering with other network operations.
 """
 
+import asyncio
 import logging
 import os
 import socket
-import struct
+import sys
 import time
 
+from ..common.protocol import LENGTH_PREFIX
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +22,9 @@ logger = logging.getLogger(__name__)
 BAUD_RATE = 300  # Bits per second
 BYTES_PER_SECOND = BAUD_RATE / 8  # 37.5 bytes per second
 
+# Progress bar width; one tick per step when animating in a terminal
+PROGRESS_STEPS = 20
+
 
 class LinkSimulator:
     """
@@ -44,6 +50,8 @@ class LinkSimulator:
         self.target_port = target_port
         self.use_tcp = use_tcp
         self.socket = None
+        # Serializes transmit_async callers the way a single 300bps link would
+        self._link_lock = asyncio.Lock()
         self._create_socket()
     
     def _create_socket(self) -> None:
@@ -60,6 +68,10 @@ class LinkSimulator:
         if self.use_tcp:
             # TCP socket (SOCK_STREAM)
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Send each framed packet immediately rather than coalescing with Nagle
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Packets can be minutes apart; keepalive surfaces a dead tunnel
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             # Connect to target for TCP
             try:
                 self.socket.connect((self.target_ip, self.target_port))
@@ -84,25 +96,13 @@ class LinkSimulator:
         Returns:
             None
         """
-        # TCP Framing: Add 4-byte length prefix for TCP mode
-        if self.use_tcp:
-            payload_length = len(payload_bytes)
-            header = struct.pack('>I', payload_length)  # Big-endian unsigned int
-            framed_payload = header + payload_bytes
-            total_bytes = len(framed_payload)
-        else:
-            # UDP mode: no framing needed
-            framed_payload = payload_bytes
-            total_bytes = len(payload_bytes)
+        framed_payload, total_bytes = self._frame(payload_bytes)
         
         # Calculate simulation delay based on 300bps constraint
         delay = total_bytes / BYTES_PER_SECOND
         
-        # Log transfer start
-        print(f"Transmitting {total_bytes} bytes @ {BAUD_RATE}bps...", end=" ", flush=True)
-        
         # Simulate transmission delay with visualization
-        self._visualize_progress(delay)
+        self._visualize_progress(delay, total_bytes)
         
         # Actual transmission
         try:
@@ -115,28 +115,120 @@ class LinkSimulator:
         except Exception as e:
             logger.error(f"Transmission error: {e}")
     
-    def _visualize_progress(self, duration: float) -> None:
+    async def transmit_async(self, payload_bytes: bytes) -> bool:
+        """
+        Send data with a simulated 300bps delay without blocking the event loop.
+        
+        Coroutine counterpart of transmit() for callers already running on
+        asyncio: the delay is awaited and TCP payloads go through
+        loop.sock_sendall, so no worker thread is needed per packet. The TCP
+        socket is switched to non-blocking mode on first use, so a simulator
+        instance should be driven through either transmit() or transmit_async(),
+        not both. Concurrent calls queue behind each other, so packets keep
+        their order and each pays its own link time, as on a real serial link.
+        
+        Args:
+            payload_bytes: Binary payload (bytes) - the msgpack serialized packet.
+                For TCP mode, a 4-byte length prefix is automatically added.
+        
+        Returns:
+            bool: True if the payload was handed to the socket, False if the
+                send failed (the error is logged).
+        """
+        framed_payload, total_bytes = self._frame(payload_bytes)
+        delay = total_bytes / BYTES_PER_SECOND
+        
+        async with self._link_lock:
+            await self._visualize_progress_async(delay, total_bytes)
+            
+            try:
+                if self.use_tcp:
+                    if self.socket.getblocking():
+                        self.socket.setblocking(False)
+                    await asyncio.get_running_loop().sock_sendall(self.socket, framed_payload)
+                else:
+                    # A datagram send completes immediately; no need to involve the loop
+                    self.socket.sendto(framed_payload, (self.target_ip, self.target_port))
+            except Exception as e:
+                logger.error(f"Transmission error: {e}")
+                return False
+        return True
+    
+    def _frame(self, payload_bytes: bytes) -> tuple[bytes, int]:
+        """
+        Apply transport framing to a payload.
+        
+        Args:
+            payload_bytes: Binary payload (bytes) - the msgpack serialized packet.
+        
+        Returns:
+            tuple: (bytes to put on the wire, their length). TCP mode prepends a
+                4-byte big-endian length prefix; UDP sends the payload as is.
+        """
+        if self.use_tcp:
+            payload_length = len(payload_bytes)
+            header = LENGTH_PREFIX.pack(payload_length)
+            framed_payload = header + payload_bytes
+        else:
+            # UDP mode: no framing needed
+            framed_payload = payload_bytes
+        return framed_payload, len(framed_payload)
+    
+    def _visualize_progress(self, duration: float, total_bytes: int) -> None:
         """
         Visualize transmission progress in the terminal.
         
         Prints a progress bar with "#" characters to provide visual feedback
-        during the simulated transmission delay.
+        during the simulated transmission delay. The bar is only drawn when
+        stdout is a terminal; otherwise the transfer is a debug log record and
+        the delay is a single sleep, so no per-packet writes reach the console.
         
         Args:
             duration: Duration in seconds to simulate.
+            total_bytes: Bytes being sent, shown in the transfer banner.
         
         Returns:
             None
         """
-        num_steps = 20
-        tick_time = duration / num_steps
+        if not sys.stdout.isatty():
+            logger.debug("Transmitting %d bytes @ %dbps (%.2fs)", total_bytes, BAUD_RATE, duration)
+            time.sleep(duration)
+            return
         
-        for i in range(num_steps):
+        print(f"Transmitting {total_bytes} bytes @ {BAUD_RATE}bps...", end=" ", flush=True)
+        tick_time = duration / PROGRESS_STEPS
+        
+        for i in range(PROGRESS_STEPS):
             time.sleep(tick_time)
             print("#", end="", flush=True)
         
         print(" Done")
     
+    async def _visualize_progress_async(self, duration: float, total_bytes: int) -> None:
+        """
+        Awaitable variant of _visualize_progress that yields to the event loop.
+        
+        Args:
+            duration: Duration in seconds to simulate.
+            total_bytes: Bytes being sent, shown in the transfer banner.
+        
+        Returns:
+            None
+        """
+        if not sys.stdout.isatty():
+            logger.debug("Transmitting %d bytes @ %dbps (%.2fs)", total_bytes, BAUD_RATE, duration)
+            await asyncio.sleep(duration)
+            return
+        
+        print(f"Transmitting {total_bytes} bytes @ {BAUD_RATE}bps...", end=" ", flush=True)
+        tick_time = duration / PROGRESS_STEPS
+        
+        for i in range(PROGRESS_STEPS):
+            await asyncio.sleep(tick_time)
+            print("#", end="", flush=True)
+        
+        print(" Done")
+    
     def close(self) -> None:
         """
         Cleanup socket connection.
@@ -0,0 +1,82 @@
+"""
+Module: Shared Model Accessors
+Purpose: Process-wide, lazily loaded instances of the heavy models (VAD,
+         Whisper, prosody, synthesis) shared by the engine and the HTTP API.
+         Each model module is imported on first use, so importing this module
+         does not pull in torch, faster-whisper or the Fish Audio SDK.
+"""
+
+import functools
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .prosody import ProsodyExtractor
+    from .synthesizer import Synthesizer
+    from .transcriber import Transcriber
+    from .vad import VoiceActivityDetector
+
+
+def load_once(factory):
+    """
+    Cache a model factory's result per arguments, loading at most once.
+
+    lru_cache alone lets concurrent first calls from different threads each
+    run the factory, so the engine loop and an API worker could load the same
+    model twice. The lock serializes the miss; hits only pay an uncontended
+    acquire.
+
+    Args:
+        factory: Function building the shared instance.
+
+    Returns:
+        Callable: Thread-safe cached wrapper with cache_clear().
+    """
+    cached = functools.lru_cache(maxsize=None)(factory)
+    lock = threading.Lock()
+
+    @functools.wraps(factory)
+    def wrapper(*args):
+        with lock:
+            return cached(*args)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@load_once
+def get_synthesizer(api_key: str, reference_audio_path: str | None) -> "Synthesizer":
+    """
+    Return the process-wide Synthesizer for the given configuration.
+
+    Cached so a receiver restart reuses the existing client instead of
+    rebuilding it. Reference audio changes are still picked up by the
+    Synthesizer's own hot-reload check.
+    """
+    from .synthesizer import Synthesizer
+
+    return Synthesizer(api_key=api_key, reference_audio_path=reference_audio_path)
+
+
+@load_once
+def get_vad() -> "VoiceActivityDetector":
+    """Return the process-wide VAD model, loading it on first use."""
+    from .vad import VoiceActivityDetector
+
+    return VoiceActivityDetector()
+
+
+@load_once
+def get_transcriber() -> "Transcriber":
+    """Return the process-wide Whisper transcriber, loading it on first use."""
+    from .transcriber import Transcriber
+
+    return Transcriber()
+
+
+@load_once
+def get_prosody() -> "ProsodyExtractor":
+    """Return the process-wide prosody extractor."""
+    from .prosody import ProsodyExtractor
+
+    return ProsodyExtractor()
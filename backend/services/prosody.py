@@ -7,20 +7,57 @@ Purpose: Uses Aubio to extract the 'Emotional Metadata' (Pitch and Energy)
 import aubio
 import numpy as np
 
+
+def frame_and_energy(audio_buffer: np.ndarray, hop_size: int) -> tuple[np.ndarray, float]:
+    """
+    Split a buffer into hop-sized analysis frames and compute its RMS energy.
+    
+    Frames are a reshaped view of the input when it divides evenly into hops;
+    otherwise a single zero-padded copy is made, instead of padding each frame
+    separately. The energy uses a dot product so no squared temporary is
+    allocated.
+    
+    Args:
+        audio_buffer: 1-D float32 audio samples.
+        hop_size: Samples per analysis frame.
+    
+    Returns:
+        tuple: (frames of shape (n_frames, hop_size), RMS energy as float)
+    """
+    total_samples = len(audio_buffer)
+    if total_samples == 0:
+        return np.empty((0, hop_size), dtype=np.float32), 0.0
+    
+    rms = float(np.sqrt(np.dot(audio_buffer, audio_buffer) / total_samples))
+    
+    n_frames = -(-total_samples // hop_size)
+    if n_frames * hop_size == total_samples and audio_buffer.flags.c_contiguous:
+        frames = audio_buffer.reshape(n_frames, hop_size)
+    else:
+        frames = np.zeros((n_frames, hop_size), dtype=np.float32)
+        frames.reshape(-1)[:total_samples] = audio_buffer
+    return frames, rms
+
+
 class ProsodyExtractor:
-    def __init__(self, sample_rate: int = 48000, hop_size: int = 512) -> None:
+    def __init__(self, sample_rate: int = 48000, hop_size: int = 512, method: str = 'yinfast') -> None:
         """
         Initialize Aubio analyzers.
         
-        Creates a pitch detection object using the YIN algorithm for fundamental
-        frequency (F0) extraction. Configures tolerance and unit settings for
+        Creates a pitch detection object for fundamental frequency (F0)
+        extraction. The default 'yinfast' computes the same YIN difference
+        function via FFT, so it tracks speech F0 like 'yin' at a fraction of
+        the per-frame cost. Configures tolerance and unit settings for
         accurate pitch analysis.
         
         Args:
-            sample_rate: Audio sample rate in Hz. Default is 44100 Hz.
+            sample_rate: Audio sample rate in Hz. Default is 48000 Hz.
             hop_size: Analysis hop size in samples. Default is 512 samples.
                 Smaller values provide higher temporal resolution at the cost
                 of increased computation.
+            method: Aubio pitch method. Default is 'yinfast'; 'yin' restores
+                the direct O(N^2) difference function, 'yinfft' trades a little
+                accuracy for more speed.
         
         Returns:
             None
@@ -28,8 +65,7 @@ class ProsodyExtractor:
         self.sample_rate = sample_rate
         self.hop_size = hop_size
         
-        # Create pitch detector (using 'yin' method)
-        self.pitch_detector = aubio.pitch('yin', 4096, hop_size, sample_rate)
+        self.pitch_detector = aubio.pitch(method, 4096, hop_size, sample_rate)
         self.pitch_detector.set_unit('Hz')
         self.pitch_detector.set_tolerance(0.8)
 
@@ -64,7 +100,7 @@ class ProsodyExtractor:
         if audio_buffer.dtype != np.float32:
             audio_buffer = audio_buffer.astype(np.float32)
         
-        rms = np.sqrt(np.mean(audio_buffer ** 2))
+        frames, rms = frame_and_energy(audio_buffer, self.hop_size)
         
         if rms < 0.05:
             energy_tag = 'Quiet'
@@ -73,21 +109,19 @@ class ProsodyExtractor:
         else:
             energy_tag = 'Loud'
         
-        pitch_values = []
-        total_samples = len(audio_buffer)
-        for i in range(0, total_samples, self.hop_size):
-            chunk = audio_buffer[i:i + self.hop_size]
-            
-            if len(chunk) < self.hop_size:
-                chunk = np.pad(chunk, (0, self.hop_size - len(chunk)), mode='constant')
-            
-            pitch = self.pitch_detector(chunk)[0]
-            
-            if pitch > 0.0:
-                pitch_values.append(pitch)
+        # aubio only exposes a per-hop streaming call, so the detector still runs
+        # once per frame, but results land in one array that is filtered and
+        # averaged in NumPy rather than grown as a Python list
+        detect_pitch = self.pitch_detector
+        pitches = np.fromiter(
+            (detect_pitch(frame)[0] for frame in frames),
+            dtype=np.float32,
+            count=len(frames),
+        )
+        voiced = pitches[pitches > 0.0]
         
-        if len(pitch_values) > 0:
-            avg_pitch = np.mean(pitch_values)
+        if voiced.size:
+            avg_pitch = float(voiced.mean())
             
             if avg_pitch < 120:
                 pitch_tag = 'Deep'
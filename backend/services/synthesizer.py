@@ -16,7 +16,7 @@ import numpy as np
 from fishaudio import FishAudio
 from fishaudio.types import ReferenceAudio
 
-from ..common.protocol import JanusMode, JanusPacket
+from ..common.protocol import JanusMode, JanusPacket, normalize_prosody_tags
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,30 @@ logger = logging.getLogger(__name__)
 SAMPLE_RATE = 48000  # Hz
 MORSE_FREQUENCY = 800  # Hz for Morse code beeps
 
+# Request options shared by every TTS call
+TTS_OPTIONS = {"format": "wav", "latency": "balanced"}
+# Stock Fish Audio voice used when no reference audio is loaded
+DEFAULT_REFERENCE_ID = "5196af35f6ff4a0dbf541793fc9f2157"
+
+# (pitch, energy) -> Fish Audio emotion tag
+_EMOTION_TAGS = {
+    ('High', 'Loud'): "excited",
+    ('High', 'Normal'): "joyful",
+    ('High', 'Quiet'): "whispering",
+    ('Normal', 'Loud'): "shouting",
+    ('Normal', 'Normal'): "relaxed",
+    ('Normal', 'Quiet'): "whispering",
+    ('Deep', 'Loud'): "shouting",
+    ('Deep', 'Normal'): "relaxed",
+    ('Deep', 'Quiet'): "sad",
+}
+
+# Energy-only fallback for pitch tags outside the table
+_ENERGY_EMOTION_TAGS = {
+    'Loud': "shouting",
+    'Quiet': "whispering",
+}
+
 class Synthesizer:
     def __init__(self, api_key: str, reference_audio_path: str | None = None):
         """
@@ -48,6 +72,8 @@ class Synthesizer:
         self.reference_audio_bytes = None
         self._reference_audio_mtime = None
         self._reference_audio_path = reference_audio_path
+        # Built once per (re)load so requests reuse the same reference payload
+        self._references = None
         
         if self._reference_audio_path:
             self._load_reference_audio(self._reference_audio_path)
@@ -63,6 +89,12 @@ class Synthesizer:
             '5': '.....', '6': '-....', '7': '--...', '8': '---..', '9': '----.',
             ' ': ' '  # Space between words
         }
+
+        # Every dot/dash tone is identical, so render each once and reuse it
+        self._morse_tones = {
+            '.': self._render_tone(0.1),
+            '-': self._render_tone(0.3),
+        }
     
     def _load_reference_audio(self, audio_path: str) -> None:
         """
@@ -86,6 +118,11 @@ class Synthesizer:
             logger.warning(f"Could not load reference audio from {audio_path}: {e}")
             self.reference_audio_bytes = None
             self._reference_audio_mtime = None
+        
+        if self.reference_audio_bytes:
+            self._references = [ReferenceAudio(audio=self.reference_audio_bytes, text="")]
+        else:
+            self._references = None
     
     def _check_and_reload_reference_audio(self) -> None:
         """
@@ -130,6 +167,36 @@ class Synthesizer:
         else:
             raise ValueError(f"Unknown packet mode: {packet.mode}")
 
+    def synthesize_into(self, packet: JanusPacket, out: np.ndarray) -> np.ndarray:
+        """
+        Synthesize a packet as int16 samples, reusing a caller-owned buffer.
+        
+        Morse code is sized from the packet and rendered in place into out
+        when it fits, or into a new array when it is longer. Remote TTS modes
+        return a view over the PCM bytes they receive, with no copy. Audio is
+        never truncated.
+        
+        Args:
+            packet: The deserialized JanusPacket containing text, mode, and metadata.
+            out: Preallocated int16 array reused for audio that fits in it.
+        
+        Returns:
+            np.ndarray: int16 PCM samples; may be a view of out, valid until
+                out is reused.
+        
+        Raises:
+            ValueError: If packet mode is unknown or unsupported.
+        """
+        if packet.mode == JanusMode.MORSE_CODE:
+            layout = self._morse_layout(packet.text)
+            total = self._morse_length(layout)
+            samples = out[:total] if total <= len(out) else np.empty(total, dtype=np.int16)
+            self._render_morse_into(layout, samples)
+            return samples
+
+        audio_bytes = self.synthesize(packet)
+        return np.frombuffer(audio_bytes, dtype=np.int16, count=len(audio_bytes) // 2)
+
     def _generate_semantic_audio(self, packet: JanusPacket) -> bytes:
         """
         Generates semantic voice audio using generative AI.
@@ -154,52 +221,22 @@ class Synthesizer:
             prosody = packet.prosody or {}
             pitch = prosody.get('pitch', 'Normal')
             energy = prosody.get('energy', 'Normal')
-            
-            if pitch == 'High' and energy == 'Loud':
-                emotion_tag = "excited"
-            elif pitch == 'High' and energy == 'Normal':
-                emotion_tag = "joyful"
-            elif pitch == 'High' and energy in ('Quiet', 'Low'):
-                emotion_tag = "whispering"
-            elif pitch == 'Low' and energy == 'Loud':
-                emotion_tag = "shouting"
-            elif pitch == 'Low' and energy == 'Low':
-                emotion_tag = "sad"
-            elif pitch == 'Low' and energy == 'Normal':
-                emotion_tag = "relaxed"
-            elif energy == 'Loud':
-                emotion_tag = "shouting"
-            elif energy in ('Quiet', 'Low'):
-                emotion_tag = "whispering"
-            else:
-                emotion_tag = "relaxed"
+            pitch, energy = normalize_prosody_tags(pitch, energy)
+            emotion_tag = _EMOTION_TAGS.get((pitch, energy))
+            if emotion_tag is None:
+                emotion_tag = _ENERGY_EMOTION_TAGS.get(energy, "relaxed")
             
             prompt = f"({emotion_tag}) {packet.text}"
 
         try:
-            references = None
-            reference_id = None
-            
-            if self.reference_audio_bytes:
-                references = [ReferenceAudio(
-                    audio=self.reference_audio_bytes,
-                    text=""
-                )]
+            if self._references:
+                audio_bytes = self.client.tts.convert(
+                    text=prompt, references=self._references, **TTS_OPTIONS
+                )
             else:
-                reference_id = "5196af35f6ff4a0dbf541793fc9f2157"
-            
-            api_params = {
-                "text": prompt,
-                "format": "wav",
-                "latency": "balanced"
-            }
-            
-            if references:
-                api_params["references"] = references
-            else:
-                api_params["reference_id"] = reference_id
-            
-            audio_bytes = self.client.tts.convert(**api_params)
+                audio_bytes = self.client.tts.convert(
+                    text=prompt, reference_id=DEFAULT_REFERENCE_ID, **TTS_OPTIONS
+                )
             return audio_bytes
             
         except Exception as e:
@@ -233,27 +270,110 @@ class Synthesizer:
             prompt = text
         
         try:
-            # Build API call parameters
-            api_params = {
-                "text": prompt,
-                "format": "wav",
-                "latency": "balanced"
-            }
-            
-            if self.reference_audio_bytes:
-                api_params["references"] = [ReferenceAudio(
-                    audio=self.reference_audio_bytes,
-                    text=""
-                )]
-            else:
-                api_params["references"] = None
-            
-            audio_bytes = self.client.tts.convert(**api_params)
+            audio_bytes = self.client.tts.convert(
+                text=prompt, references=self._references, **TTS_OPTIONS
+            )
             return audio_bytes
         except Exception as e:
             logger.error(f"Fast TTS error: {e}")
             return b''
 
+    @staticmethod
+    def _render_tone(duration: float) -> np.ndarray:
+        """
+        Render a single Morse tone at MORSE_FREQUENCY.
+        
+        Args:
+            duration: Tone length in seconds.
+        
+        Returns:
+            np.ndarray: int16 sine wave at half amplitude.
+        """
+        samples = int(duration * SAMPLE_RATE)
+        t = np.linspace(0, duration, samples, False)
+        wave = np.sin(2 * np.pi * MORSE_FREQUENCY * t)
+        return (wave * 32767 * 0.5).astype(np.int16)
+
+    def _morse_layout(self, text: str) -> list:
+        """
+        Plan the Morse timeline for text as tone arrays and silence lengths.
+        
+        Dots (.) are 0.1s tones and dashes (-) 0.3s tones. Silence of 0.1s
+        separates symbols, 0.3s separates letters and 0.7s marks a word gap.
+        
+        Args:
+            text: Text string to convert to Morse code.
+        
+        Returns:
+            list: Sequence of np.ndarray tones and int silence sample counts.
+        """
+        layout = []
+        symbol_gap = int(0.1 * SAMPLE_RATE)
+        letter_gap = int(0.3 * SAMPLE_RATE)
+        word_gap = int(0.7 * SAMPLE_RATE)
+
+        text_upper = text.upper()
+        for char in text_upper:
+            pattern = self.morse_code_dict.get(char)
+            if pattern is None:
+                continue
+
+            if pattern == ' ':
+                layout.append(word_gap)
+                continue
+
+            for i, symbol in enumerate(pattern):
+                tone = self._morse_tones.get(symbol)
+                if tone is None:
+                    continue
+                layout.append(tone)
+                if i < len(pattern) - 1:
+                    layout.append(symbol_gap)
+
+            if char != text_upper[-1]:
+                layout.append(letter_gap)
+        return layout
+
+    @staticmethod
+    def _morse_length(layout: list) -> int:
+        """
+        Count the samples a planned Morse timeline renders to.
+        
+        Args:
+            layout: Tones and silence lengths from _morse_layout.
+        
+        Returns:
+            int: Total number of samples.
+        """
+        return sum(segment if isinstance(segment, int) else len(segment) for segment in layout)
+
+    @staticmethod
+    def _render_morse_into(layout: list, out: np.ndarray) -> int:
+        """
+        Write a planned Morse timeline directly into out.
+        
+        Args:
+            layout: Tones and silence lengths from _morse_layout.
+            out: Preallocated int16 array; output beyond its length is truncated.
+        
+        Returns:
+            int: Number of samples written to the start of out.
+        """
+        capacity = len(out)
+        position = 0
+        for segment in layout:
+            if position >= capacity:
+                logger.warning("Morse audio truncated to output buffer size")
+                break
+            if isinstance(segment, int):
+                end = min(position + segment, capacity)
+                out[position:end] = 0
+            else:
+                end = min(position + len(segment), capacity)
+                out[position:end] = segment[:end - position]
+            position = end
+        return position
+
     def _generate_morse_audio(self, text: str) -> bytes:
         """
         Generates Morse code audio from text using sine wave tones.
@@ -270,57 +390,7 @@ class Synthesizer:
             bytes: Raw PCM audio data (int16 format) ready for PyAudio playback.
                 Returns empty bytes if text is empty or contains no valid characters.
         """
-        audio_segments = []
-        
-        # Convert text to uppercase for morse code lookup
-        text_upper = text.upper()
-        
-        for char in text_upper:
-            if char in self.morse_code_dict:
-                pattern = self.morse_code_dict[char]
-                
-                # Handle space (word separator)
-                if pattern == ' ':
-                    # Add longer silence between words (0.7s)
-                    silence_samples = int(0.7 * SAMPLE_RATE)
-                    audio_segments.append(np.zeros(silence_samples, dtype=np.int16))
-                    continue
-                
-                # Generate audio for each dot/dash in the pattern
-                for i, symbol in enumerate(pattern):
-                    if symbol == '.':
-                        # Dot: 0.1s tone
-                        duration = 0.1
-                    elif symbol == '-':
-                        # Dash: 0.3s tone
-                        duration = 0.3
-                    else:
-                        continue
-                    
-                    # Generate sine wave
-                    samples = int(duration * SAMPLE_RATE)
-                    t = np.linspace(0, duration, samples, False)
-                    wave = np.sin(2 * np.pi * MORSE_FREQUENCY * t)
-                    
-                    # Convert to int16 and scale
-                    wave_int16 = (wave * 32767 * 0.5).astype(np.int16)
-                    audio_segments.append(wave_int16)
-                    
-                    # Add silence between symbols (0.1s) except after last symbol
-                    if i < len(pattern) - 1:
-                        silence_samples = int(0.1 * SAMPLE_RATE)
-                        audio_segments.append(np.zeros(silence_samples, dtype=np.int16))
-                
-                # Add silence between letters (0.3s) except after last character
-                if char != text_upper[-1]:
-                    silence_samples = int(0.3 * SAMPLE_RATE)
-                    audio_segments.append(np.zeros(silence_samples, dtype=np.int16))
-        
-        # Concatenate all segments
-        if audio_segments:
-            audio_array = np.concatenate(audio_segments)
-        else:
-            audio_array = np.array([], dtype=np.int16)
-        
-        # Convert to bytes
-        return audio_array.tobytes()
\ No newline at end of file
+        layout = self._morse_layout(text)
+        audio_array = np.empty(self._morse_length(layout), dtype=np.int16)
+        self._render_morse_into(layout, audio_array)
+        return audio_array.tobytes()
@@ -7,8 +7,17 @@ Purpose: Acts as the 'Gatekeeper'. Uses Silero-VAD to analyze audio chunks
 import numpy as np
 import torch
 
+# RMS (normalized full scale) below which a chunk is treated as silence
+# without running the model; ~-60 dBFS sits under any usable speech level
+NOISE_FLOOR_RMS = 1e-3
+
 class VoiceActivityDetector:
-    def __init__(self, threshold: float = 0.5, sample_rate: int = 48000) -> None:
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        sample_rate: int = 48000,
+        noise_floor_rms: float = NOISE_FLOOR_RMS,
+    ) -> None:
         """
         Initialize the VAD Model.
         
@@ -22,9 +31,13 @@ class VoiceActivityDetector:
                 Default is 0.5.
             sample_rate: Input audio sample rate in Hz. Default is 44100 Hz.
                 The model will downsample to 16kHz internally if needed.
+            noise_floor_rms: Chunks with RMS below this level are classified as
+                silence without a model forward pass. 0 disables the gate.
         """
         self.threshold = threshold
         self.sample_rate = sample_rate
+        # Compared against sum of squares, so no sqrt or divide per chunk
+        self._noise_floor_sq = noise_floor_rms * noise_floor_rms
         
         # Load Silero VAD model v4 from torch.hub
         self.model, self.utils = torch.hub.load(
@@ -49,6 +62,14 @@ class VoiceActivityDetector:
             bool: True if speech is detected (probability exceeds threshold),
                 False otherwise.
         """
+        # Idle silence dominates the stream; a dot product is far cheaper than
+        # the model forward pass
+        if (
+            isinstance(audio_chunk, np.ndarray)
+            and float(np.dot(audio_chunk, audio_chunk)) < self._noise_floor_sq * len(audio_chunk)
+        ):
+            return False
+
         if self.sample_rate == 48000:
             audio_chunk = audio_chunk[::3]
             vad_sample_rate = 16000  # Silero VAD expects 16k
@@ -76,6 +97,41 @@ class VoiceActivityDetector:
         # Return True if probability exceeds threshold
         return speech_prob > self.threshold
 
+    def is_speech_batch(self, audio_chunks: np.ndarray) -> np.ndarray:
+        """
+        Classifies a batch of consecutive chunks from the same stream.
+
+        Downsampling and tensor conversion are done once for the whole batch.
+        Silero VAD carries recurrent state from one chunk to the next, so rows
+        are still fed to the model in order rather than as independent batch
+        entries. Chunks under the noise floor are marked silent without
+        inference.
+
+        Args:
+            audio_chunks: A (num_chunks, samples) float32 array of audio chunks
+                normalized between -1.0 and 1.0, oldest first.
+
+        Returns:
+            np.ndarray: Boolean array with one speech decision per chunk.
+        """
+        energies = np.einsum('ij,ij->i', audio_chunks, audio_chunks)
+        audible = energies >= self._noise_floor_sq * audio_chunks.shape[1]
+
+        if self.sample_rate in (48000, 44100):
+            audio_chunks = audio_chunks[:, ::3]
+            vad_sample_rate = 16000
+        else:
+            vad_sample_rate = self.sample_rate
+
+        batch = torch.from_numpy(np.ascontiguousarray(audio_chunks, dtype=np.float32))
+        speech_probs = np.zeros(len(batch), dtype=np.float32)
+
+        with torch.no_grad():
+            for i in np.flatnonzero(audible):
+                speech_probs[i] = self.model(batch[int(i)].unsqueeze(0), vad_sample_rate).item()
+
+        return speech_probs > self.threshold
+
     def reset(self) -> None:
         """
         Reset the model state.
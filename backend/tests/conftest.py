@@ -66,6 +66,34 @@ class MockAudioService:
         # Default: return zeros (silence)
         return np.zeros(self.CHUNK_SIZE, dtype=np.float32)
     
+    def read_chunk_into(self, out: np.ndarray) -> int:
+        """
+        Read a chunk of audio data into a caller-provided buffer.
+        
+        Args:
+            out: float32 array of at least CHUNK_SIZE samples.
+        
+        Returns:
+            int: Number of samples written.
+        """
+        out[:self.CHUNK_SIZE] = self.read_chunk()
+        return self.CHUNK_SIZE
+    
+    def start_capture(self, ring) -> bool:
+        """
+        Report that callback capture is unavailable so callers poll read_chunk_into().
+        
+        Args:
+            ring: Capture ring (unused).
+        
+        Returns:
+            bool: Always False.
+        """
+        return False
+    
+    def stop_capture(self) -> None:
+        """No-op; the mock never starts callback capture."""
+    
     def write_chunk(self, audio_data: bytes | np.ndarray | None) -> None:
         """
         Write audio data (captures instead of playing).
@@ -1,53 +1,258 @@
-import queue
-import threading
-from unittest.mock import MagicMock
+import asyncio
+import collections
+import socket
+import struct
+from unittest.mock import AsyncMock, MagicMock
 
+import msgpack
 import numpy as np
 import pytest
 
+from backend.api.types import JanusMode, PacketSummaryMessage, TranscriptMessage
 from backend.common import engine_state
+from backend.common.protocol import JanusMode as ProtocolJanusMode, JanusPacket
 from backend.services.engine import (
+    MAX_PENDING_TRANSMISSIONS,
+    _build_events,
+    _drain_outbox,
+    _enqueue_event,
+    _prosody_or_default,
+    _queue_packet,
+    _serve_connection,
+    _transmit_and_report,
+    _transcribe_or_empty,
     apply_ducking_if_needed,
-    playback_worker,
-    recv_exact,
+    apply_ducking_in_place,
+    map_api_mode_to_protocol_mode,
+    map_protocol_mode_to_api_mode,
+    recv_into_exact,
+    smart_ear_loop,
 )
 
 
-def test_recv_exact_success():
-    """Verify it reads exactly N bytes even if socket chunks them."""
-    mock_sock = MagicMock()
-    # Simulate receiving 2 bytes, then 2 bytes for a request of 4 bytes
-    mock_sock.recv.side_effect = [b'AB', b'CD']
-    result = recv_exact(mock_sock, 4)
-    assert result == b'ABCD'
-
-
-def test_recv_exact_closed():
-    """Verify it returns None on connection close."""
-    mock_sock = MagicMock()
-    mock_sock.recv.return_value = b''
-    result = recv_exact(mock_sock, 4)
-    assert result is None
-
-
-def test_playback_worker():
-    """Verify audio bytes are pulled from queue and written to service."""
-    mock_audio = MagicMock()
-    q = queue.Queue()
-    stop_event = threading.Event()
-    
-    q.put(b'audio_data')
-    
-    # Run worker in a thread that we stop immediately
-    def stop_soon():
-        import time
-        time.sleep(0.1)
-        stop_event.set()
-        
-    threading.Thread(target=stop_soon).start()
-    playback_worker(mock_audio, q, stop_event)
-    
-    mock_audio.write_chunk.assert_called_with(b'audio_data')
+def _read_exact(chunks, size):
+    """Send byte chunks through a socket pair and read `size` bytes with recv_into_exact."""
+    async def run():
+        reader, writer = socket.socketpair()
+        reader.setblocking(False)
+        try:
+            for chunk in chunks:
+                writer.sendall(chunk)
+            writer.shutdown(socket.SHUT_WR)
+            buffer = bytearray(size)
+            ok = await recv_into_exact(reader, memoryview(buffer))
+            return ok, buffer
+        finally:
+            reader.close()
+            writer.close()
+
+    return asyncio.run(run())
+
+
+def test_recv_into_exact_success():
+    """Verify it fills the view exactly even if the sender chunks the data."""
+    ok, buffer = _read_exact([b'AB', b'CD'], 4)
+    assert ok
+    assert buffer == b'ABCD'
+
+
+def test_recv_into_exact_leaves_following_bytes():
+    """Verify only the requested frame is consumed from the stream."""
+    ok, buffer = _read_exact([b'WXYZ-next'], 4)
+    assert ok
+    assert buffer == b'WXYZ'
+
+
+def test_recv_into_exact_closed():
+    """Verify it reports a connection closed before the view is full."""
+    ok, _ = _read_exact([b'AB'], 4)
+    assert not ok
+
+
+def test_serve_connection_drops_oversized_length_prefix():
+    """A length prefix above MAX_PACKET_BYTES ends the connection before any payload is read."""
+    async def run():
+        reader, writer = socket.socketpair()
+        reader.setblocking(False)
+        try:
+            writer.sendall(struct.pack('>I', 0xFFFFFFFF) + b'junk')
+            synthesizer = MagicMock()
+            await asyncio.wait_for(
+                _serve_connection(reader, MagicMock(), synthesizer, None), timeout=1.0
+            )
+            return synthesizer
+        finally:
+            reader.close()
+            writer.close()
+
+    synthesizer = asyncio.run(run())
+    synthesizer.synthesize_into.assert_not_called()
+
+
+def test_build_events_serialize_like_validated_models():
+    """Unvalidated event construction produces the same JSON as validated models."""
+    transcript_msg, packet_msg = _build_events(
+        text="hello there",
+        avg_pitch_hz=180.0,
+        avg_energy=None,
+        mode=JanusMode.TEXT_ONLY,
+        emotion="Joyful",
+    )
+
+    expected_transcript = TranscriptMessage(**transcript_msg.model_dump())
+    expected_packet = PacketSummaryMessage(**packet_msg.model_dump())
+    assert transcript_msg.model_dump_json() == expected_transcript.model_dump_json()
+    assert packet_msg.model_dump_json() == expected_packet.model_dump_json()
+    assert packet_msg.bytes == len("hello there") + 16
+    assert packet_msg.snippet == "hello there"
+
+    _, morse_msg = _build_events(
+        text="sos",
+        avg_pitch_hz=None,
+        avg_energy=None,
+        mode=JanusMode.MORSE,
+        payload_bytes=27,
+    )
+    assert morse_msg.bytes == 27
+
+
+def test_enqueue_event_evicts_oldest_when_full():
+    """A full event queue drops its oldest event so the newest is always delivered."""
+    event_queue = asyncio.Queue(maxsize=2)
+    for event in ("first", "second", "third"):
+        _enqueue_event(event_queue, event)
+
+    assert event_queue.get_nowait() == "second"
+    assert event_queue.get_nowait() == "third"
+
+
+def test_transmit_and_report_emits_summary_only_after_send():
+    """The packet summary reaches the frontend only when the link accepted the payload."""
+    packet_queue = asyncio.Queue()
+    link = MagicMock()
+
+    link.transmit_async = AsyncMock(return_value=False)
+    asyncio.run(_transmit_and_report(link, b"payload", "summary", packet_queue))
+    assert packet_queue.empty()
+
+    link.transmit_async = AsyncMock(return_value=True)
+    asyncio.run(_transmit_and_report(link, b"payload", "summary", packet_queue))
+    link.transmit_async.assert_awaited_once_with(b"payload")
+    assert packet_queue.get_nowait() == "summary"
+
+
+def test_queue_packet_merges_utterances_once_the_backlog_is_full():
+    """Utterances past the cap are folded into the newest waiting packet, not dropped."""
+    outbox = collections.deque()
+    for text in ("one", "two", "three", "four"):
+        _queue_packet(outbox, JanusPacket(text, ProtocolJanusMode.TEXT_ONLY, {}))
+
+    assert len(outbox) == MAX_PENDING_TRANSMISSIONS
+    assert [packet.text for packet in outbox] == ["one", "two three four"]
+
+
+def test_drain_outbox_sends_queued_packets_in_order():
+    """Each queued packet is serialized, sent, and reported with its wire size."""
+    async def run():
+        outbox = collections.deque(
+            [JanusPacket("first", ProtocolJanusMode.TEXT_ONLY, {}),
+             JanusPacket("second", ProtocolJanusMode.TEXT_ONLY, {})]
+        )
+        packet_queue = asyncio.Queue()
+        link = MagicMock()
+        link.transmit_async = AsyncMock(return_value=True)
+        drain = asyncio.create_task(
+            _drain_outbox(link, outbox, asyncio.Event(), msgpack.Packer(use_bin_type=True), packet_queue)
+        )
+        summaries = [await packet_queue.get(), await packet_queue.get()]
+        drain.cancel()
+        await asyncio.gather(drain, return_exceptions=True)
+        return link, summaries
+
+    link, summaries = asyncio.run(run())
+    sent = [JanusPacket.deserialize(call.args[0]).text for call in link.transmit_async.await_args_list]
+    assert sent == ["first", "second"]
+    assert [summary.snippet for summary in summaries] == ["first", "second"]
+    assert summaries[0].bytes == len(link.transmit_async.await_args_list[0].args[0])
+
+
+def test_smart_ear_loop_emits_one_transcript_and_packet_per_utterance(monkeypatch, mock_audio_service):
+    """Two utterances captured in one burst go through batched VAD and are each sent once."""
+    chunk_size = mock_audio_service.CHUNK_SIZE
+    speech = [np.full(chunk_size, 0.5, dtype=np.float32)] * 20
+    silence = [np.zeros(chunk_size, dtype=np.float32)] * 16  # past the 15-chunk threshold
+    pattern = (speech + silence) * 2
+
+    def start_capture(ring):
+        # Everything is pending before the loop first drains the ring
+        for chunk in pattern:
+            assert ring.push(chunk)
+        return True
+
+    mock_audio_service.start_capture = start_capture
+
+    vad = MagicMock()
+    vad.is_speech_batch.side_effect = lambda batch: [bool(chunk.max() > 0.1) for chunk in batch]
+    transcriber = MagicMock()
+    transcriber.transcribe_buffer.return_value = "hello there"
+    prosody = MagicMock()
+    prosody.analyze_buffer.return_value = {"energy": "Normal", "pitch": "Normal"}
+    link = MagicMock()
+    link.transmit_async = AsyncMock(return_value=True)
+    monkeypatch.setattr("backend.services.engine.get_vad", lambda: vad)
+    monkeypatch.setattr("backend.services.engine.get_transcriber", lambda: transcriber)
+    monkeypatch.setattr("backend.services.engine.get_prosody", lambda: prosody)
+    monkeypatch.setattr("backend.services.engine.LinkSimulator", lambda **kwargs: link)
+
+    state = engine_state.control_state
+    state.is_streaming = True
+
+    async def run():
+        transcript_queue = asyncio.Queue()
+        packet_queue = asyncio.Queue()
+        loop_task = asyncio.create_task(
+            smart_ear_loop(state, transcript_queue, packet_queue, mock_audio_service)
+        )
+        summaries = [
+            await asyncio.wait_for(packet_queue.get(), timeout=5.0),
+            await asyncio.wait_for(packet_queue.get(), timeout=5.0),
+        ]
+        await asyncio.sleep(0.1)  # room for any duplicate event to show up
+        loop_task.cancel()
+        await asyncio.gather(loop_task, return_exceptions=True)
+        transcripts = [transcript_queue.get_nowait() for _ in range(transcript_queue.qsize())]
+        return transcripts, summaries, packet_queue.qsize()
+
+    transcripts, summaries, extra_packets = asyncio.run(run())
+
+    assert [msg.text for msg in transcripts] == ["hello there", "hello there"]
+    assert [msg.snippet for msg in summaries] == ["hello there", "hello there"]
+    assert extra_packets == 0
+    assert transcriber.transcribe_buffer.call_count == 2
+    assert link.transmit_async.await_count == 2
+    vad.is_speech_batch.assert_called_once()
+    assert len(vad.is_speech_batch.call_args.args[0]) == len(pattern)
+    vad.is_speech.assert_not_called()
+    link.close.assert_called_once_with()
+
+
+def test_processing_helpers_fall_back_on_errors():
+    """Transcribe and prosody failures degrade to empty text and neutral tags."""
+    audio = np.zeros(16, dtype=np.float32)
+    failing = MagicMock()
+    failing.transcribe_buffer.side_effect = RuntimeError("model crashed")
+    failing.analyze_buffer.side_effect = RuntimeError("aubio crashed")
+
+    assert _transcribe_or_empty(failing, audio) == ""
+    assert _prosody_or_default(failing, audio) == {"energy": "Normal", "pitch": "Normal"}
+
+
+def test_mode_mapping_round_trips():
+    """API and protocol modes map onto each other and unknown values fall back to semantic."""
+    for api_mode in JanusMode:
+        assert map_protocol_mode_to_api_mode(map_api_mode_to_protocol_mode(api_mode)) == api_mode
+    assert map_api_mode_to_protocol_mode("bogus") == ProtocolJanusMode.SEMANTIC_VOICE
+    assert map_protocol_mode_to_api_mode(99) == JanusMode.SEMANTIC
 
 
 def test_audio_ducking(reset_ducking_state):
@@ -85,6 +290,25 @@ def test_audio_ducking(reset_ducking_state):
     assert out_empty == empty_bytes
 
 
+def test_audio_ducking_in_place(reset_ducking_state):
+    """In-place ducking matches the bytes path and leaves audio alone when idle."""
+    state = reset_ducking_state
+    original = np.array([1000, -2000, 0, 32767, -32768], dtype=np.int16)
+
+    state.ducking_enabled = True
+    state.is_talking = False
+    samples = original.copy()
+    apply_ducking_in_place(samples, state)
+    assert np.array_equal(samples, original)
+
+    state.is_talking = True
+    state.ducking_level = 0.5
+    samples = original.copy()
+    apply_ducking_in_place(samples, state)
+    expected = np.frombuffer(apply_ducking_if_needed(original.tobytes(), state), dtype=np.int16)
+    assert np.array_equal(samples, expected)
+
+
 @pytest.fixture
 def reset_ducking_state():
     """Fixture to reset ducking-related control state between tests."""
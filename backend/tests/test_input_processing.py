@@ -4,10 +4,10 @@ Tests AudioService, VoiceActivityDetector, Transcriber, ProsodyExtractor, and se
 """
 
 import os
-import queue
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import numpy as np
@@ -17,8 +17,14 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from backend.scripts.sender_main import audio_consumer, audio_producer
-from backend.services.audio_io import AudioService
-from backend.services.prosody import ProsodyExtractor
+from backend.services.audio_io import (
+    AudioService,
+    ChunkRing,
+    PlaybackQueue,
+    PreRollBuffer,
+    UtteranceBuffer,
+)
+from backend.services.prosody import ProsodyExtractor, frame_and_energy
 from backend.services.transcriber import Transcriber
 from backend.services.vad import VoiceActivityDetector
 
@@ -122,7 +128,7 @@ class TestAudioService:
         mock_input_stream = MagicMock()
         mock_output_stream = MagicMock()
         
-        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None):
+        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None, stream_callback=None):
             if input:
                 return mock_input_stream
             elif output:
@@ -147,7 +153,7 @@ class TestAudioService:
         mock_input_stream = MagicMock()
         mock_output_stream = MagicMock()
         
-        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None):
+        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None, stream_callback=None):
             if input:
                 return mock_input_stream
             elif output:
@@ -178,7 +184,7 @@ class TestAudioService:
         mock_input_stream = MagicMock()
         mock_output_stream = MagicMock()
         
-        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None):
+        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None, stream_callback=None):
             if input:
                 return mock_input_stream
             elif output:
@@ -199,6 +205,30 @@ class TestAudioService:
         assert len(chunk) == 1536  # CHUNK_SIZE
         assert np.all(chunk == 0.0)
     
+    @patch('backend.services.audio_io.pyaudio')
+    def test_read_chunk_into_fills_ring_slot(self, mock_pyaudio_module):
+        """Test read_chunk_into converts in place into a borrowed ChunkRing slot."""
+        mock_pa = MagicMock()
+        mock_input_stream = MagicMock()
+        
+        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None, stream_callback=None):
+            return mock_input_stream if input else MagicMock()
+        
+        mock_pa.open.side_effect = open_stream
+        mock_pyaudio_module.PyAudio.return_value = mock_pa
+        samples = np.array([1000, -1000, 2000, -2000], dtype=np.int16)
+        mock_input_stream.read.return_value = samples.tobytes()
+        
+        service = AudioService()
+        ring = ChunkRing(2, 8)
+        slot = ring.acquire()
+        ring.commit(service.read_chunk_into(slot))
+        
+        out = np.empty(8, dtype=np.float32)
+        chunk = ring.pop_into(out)
+        assert np.allclose(chunk, samples / 32768.0)
+        assert ring.acquire() is not None
+    
     @patch('backend.services.audio_io.pyaudio')
     def test_write_chunk_with_numpy_array(self, mock_pyaudio_module):
         """Test write_chunk handles numpy array input."""
@@ -207,7 +237,7 @@ class TestAudioService:
         mock_input_stream = MagicMock()
         mock_output_stream = MagicMock()
         
-        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None):
+        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None, stream_callback=None):
             if input:
                 return mock_input_stream
             elif output:
@@ -223,10 +253,14 @@ class TestAudioService:
         audio_data = np.array([0.5, -0.5, 0.3], dtype=np.float32)
         service.write_chunk(audio_data)
         
-        # Verify write was called
-        assert mock_output_stream.write.called
-        written_bytes = mock_output_stream.write.call_args[0][0]
+        # Verify the output callback drains the queued samples
+        callback = mock_pa.open.call_args_list[1].kwargs['stream_callback']
+        written_bytes, _ = callback(None, 3, {}, 0)
         assert isinstance(written_bytes, bytes)
+        assert np.array_equal(
+            np.frombuffer(written_bytes, dtype=np.int16),
+            (audio_data * 32768.0).astype(np.int16),
+        )
     
     @patch('backend.services.audio_io.pyaudio')
     def test_write_chunk_with_bytes(self, mock_pyaudio_module):
@@ -236,7 +270,7 @@ class TestAudioService:
         mock_input_stream = MagicMock()
         mock_output_stream = MagicMock()
         
-        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None):
+        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None, stream_callback=None):
             if input:
                 return mock_input_stream
             elif output:
@@ -249,11 +283,152 @@ class TestAudioService:
         service = AudioService()
         
         # Test with bytes
-        audio_bytes = b'\x00' * 1024
+        audio_bytes = np.arange(512, dtype=np.int16).tobytes()
         service.write_chunk(audio_bytes)
         
-        assert mock_output_stream.write.called
-        assert mock_output_stream.write.call_args[0][0] == audio_bytes
+        callback = mock_pa.open.call_args_list[1].kwargs['stream_callback']
+        written_bytes, _ = callback(None, 512, {}, 0)
+        assert written_bytes == audio_bytes
+        mock_output_stream.write.assert_not_called()
+    
+    @patch('backend.services.audio_io.pyaudio')
+    def test_playback_filter_runs_on_drained_samples_only(self, mock_pyaudio_module):
+        """Test the output callback applies playback_filter at play time, not to padding."""
+        mock_pa = MagicMock()
+        mock_pa.open.side_effect = lambda **kwargs: MagicMock()
+        mock_pyaudio_module.PyAudio.return_value = mock_pa
+        
+        service = AudioService()
+        service.write_chunk(np.array([100, 200], dtype=np.int16))
+        seen = []
+        
+        def halve(samples):
+            seen.append(len(samples))
+            samples //= 2
+        
+        # Set after queuing: the gain in force during playback is what applies
+        service.playback_filter = halve
+        callback = mock_pa.open.call_args_list[1].kwargs['stream_callback']
+        written_bytes, _ = callback(None, 4, {}, 0)
+        assert np.frombuffer(written_bytes, dtype=np.int16).tolist() == [50, 100, 0, 0]
+        assert seen == [2]
+        
+        callback(None, 4, {}, 0)
+        assert seen == [2]  # Pure silence is not filtered
+    
+    @patch('backend.services.audio_io.pyaudio')
+    def test_start_capture_fills_ring_from_callback(self, mock_pyaudio_module):
+        """Test start_capture reopens input in callback mode and converts into ring slots."""
+        mock_pa = MagicMock()
+        mock_pa.open.side_effect = lambda **kwargs: MagicMock()
+        mock_pyaudio_module.PyAudio.return_value = mock_pa
+        
+        service = AudioService()
+        ring = ChunkRing(2, service.CHUNK_SIZE)
+        
+        assert service.start_capture(ring)
+        callback = mock_pa.open.call_args_list[-1].kwargs['stream_callback']
+        assert mock_pa.open.call_args_list[-1].kwargs['input']
+        
+        pcm = np.full(service.CHUNK_SIZE, 16384, dtype=np.int16)
+        callback(pcm.tobytes(), service.CHUNK_SIZE, {}, 0)
+        chunk = ring.pop_into(np.empty(service.CHUNK_SIZE, dtype=np.float32))
+        assert np.allclose(chunk, 0.5)
+        
+        service.stop_capture()
+        assert mock_pa.open.call_args_list[-1].kwargs['stream_callback'] is None
+    
+    def test_playback_queue_plays_utterances_in_order_and_pads_silence(self):
+        """Test PlaybackQueue reads across utterance boundaries and zero-fills underruns."""
+        queue = PlaybackQueue()
+        out = np.empty(3, dtype=np.int16)
+        
+        assert queue.write(np.array([1, 2], dtype=np.int16)) == 0
+        assert queue.write(np.array([3, 4, 5, 6], dtype=np.int16)) == 0
+        assert len(queue) == 6
+        assert queue.read_into(out) == 3
+        assert out.tolist() == [1, 2, 3]
+        assert queue.read_into(out) == 3
+        assert out.tolist() == [4, 5, 6]
+        assert queue.read_into(out) == 0
+        assert out.tolist() == [0, 0, 0]
+    
+    def test_playback_queue_keeps_utterances_longer_than_the_backlog(self):
+        """Test PlaybackQueue never truncates a single long utterance."""
+        queue = PlaybackQueue(max_backlog=4)
+        samples = np.arange(10, dtype=np.int16)
+        out = np.empty(10, dtype=np.int16)
+        
+        assert queue.write(samples) == 0
+        samples[:] = 0  # The caller may reuse its buffer straight away
+        assert queue.read_into(out) == 10
+        assert out.tolist() == list(range(10))
+    
+    def test_playback_queue_drops_whole_queued_utterances_beyond_backlog(self):
+        """Test PlaybackQueue drops unplayed utterances whole and never cuts the one playing."""
+        queue = PlaybackQueue(max_backlog=6)
+        out = np.empty(2, dtype=np.int16)
+        
+        queue.write(np.array([1, 2, 3, 4], dtype=np.int16))
+        assert queue.read_into(out) == 2  # First utterance is now playing
+        queue.write(np.array([5, 6], dtype=np.int16))
+        assert queue.write(np.array([7, 8, 9], dtype=np.int16)) == 2
+        assert len(queue) == 5
+        
+        played = np.empty(8, dtype=np.int16)
+        assert queue.read_into(played) == 5
+        assert played[:5].tolist() == [3, 4, 7, 8, 9]
+    
+    def test_chunk_ring_notifies_on_commit(self):
+        """Test ChunkRing runs on_commit once per published chunk, not for dropped pushes."""
+        notify = MagicMock()
+        ring = ChunkRing(1, 4, on_commit=notify)
+        
+        assert ring.push(np.ones(4, dtype=np.float32))
+        assert not ring.push(np.ones(4, dtype=np.float32))
+        notify.assert_called_once_with()
+    
+    def test_chunk_ring_fifo_and_full_drop(self):
+        """Test ChunkRing returns chunks in order and drops pushes while full."""
+        ring = ChunkRing(2, 4)
+        scratch = np.empty(4, dtype=np.float32)
+        
+        assert ring.push(np.ones(4, dtype=np.float32))
+        assert ring.push(np.full(3, 2.0, dtype=np.float32))
+        assert not ring.push(np.zeros(4, dtype=np.float32))  # Full
+        
+        assert ring.pop_into(scratch).tolist() == [1.0, 1.0, 1.0, 1.0]
+        assert ring.pop_into(scratch).tolist() == [2.0, 2.0, 2.0]
+        assert ring.pop_into(scratch) is None
+        assert not ring.wait(0.01)
+    
+    def test_utterance_buffer_grows_and_reuses_storage(self):
+        """Test UtteranceBuffer grows past its initial capacity and clear() keeps the allocation."""
+        buffer = UtteranceBuffer(4)
+        buffer.append(np.array([1, 2, 3], dtype=np.float32))
+        buffer.extend([np.array([4, 5], dtype=np.float32), np.array([6], dtype=np.float32)])
+        
+        assert len(buffer) == 6
+        assert buffer.view().tolist() == [1, 2, 3, 4, 5, 6]
+        
+        buffer.clear()
+        assert len(buffer) == 0
+        buffer.append(np.array([7], dtype=np.float32))
+        assert buffer.view().tolist() == [7]
+    
+    def test_pre_roll_buffer_keeps_most_recent_chunks_in_order(self):
+        """Test PreRollBuffer retains only the newest chunks, oldest first, in fixed storage."""
+        pre_roll = PreRollBuffer(3, 4)
+        for value in range(5):
+            pre_roll.append(np.full(4, value, dtype=np.float32))
+        pre_roll.append(np.array([9, 9], dtype=np.float32))
+        
+        assert len(pre_roll) == 3
+        assert [chunk.tolist() for chunk in pre_roll] == [[3] * 4, [4] * 4, [9, 9]]
+        
+        buffer = UtteranceBuffer(4)
+        buffer.extend(pre_roll)
+        assert len(buffer) == 10
     
     @patch('backend.services.audio_io.pyaudio')
     def test_close(self, mock_pyaudio_module):
@@ -263,7 +438,7 @@ class TestAudioService:
         mock_input_stream = MagicMock()
         mock_output_stream = MagicMock()
         
-        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None):
+        def open_stream(format=None, channels=None, rate=None, input=False, output=False, frames_per_buffer=None, stream_callback=None):
             if input:
                 return mock_input_stream
             elif output:
@@ -352,6 +527,40 @@ class TestVoiceActivityDetector:
         
         assert result == False  # 0.2 < 0.5
     
+    @patch('backend.services.vad.torch.hub.load')
+    def test_is_speech_skips_model_below_noise_floor(self, mock_hub_load):
+        """Test chunks under the noise floor are rejected without running the model."""
+        mock_hub_load.return_value = (MagicMock(), MagicMock())
+        
+        vad = VoiceActivityDetector(threshold=0.5)
+        
+        fresh_mock_model = MagicMock()
+        fresh_mock_model.return_value.item.return_value = 0.9
+        vad.model = fresh_mock_model
+        
+        assert vad.is_speech(generate_silence()) == False
+        assert vad.is_speech_batch(np.zeros((2, 1536), dtype=np.float32)).tolist() == [False, False]
+        fresh_mock_model.assert_not_called()
+    
+    @patch('backend.services.vad.torch.hub.load')
+    def test_is_speech_batch_classifies_each_chunk_in_order(self, mock_hub_load):
+        """Test is_speech_batch returns one decision per chunk, evaluated sequentially."""
+        mock_hub_load.return_value = (MagicMock(), MagicMock())
+        
+        vad = VoiceActivityDetector(threshold=0.5, sample_rate=48000)
+        
+        fresh_mock_model = MagicMock()
+        fresh_mock_model.return_value.item.side_effect = [0.9, 0.1, 0.7]
+        vad.model = fresh_mock_model
+        
+        batch = np.stack([generate_audio_chunk() for _ in range(3)])
+        result = vad.is_speech_batch(batch)
+        
+        assert result.tolist() == [True, False, True]
+        assert fresh_mock_model.call_count == 3
+        # Each row is downsampled 48k -> 16k before inference
+        assert fresh_mock_model.call_args[0][0].shape == (1, 512)
+    
     @patch('backend.services.vad.torch.hub.load')
     def test_reset(self, mock_hub_load):
         """Test reset method (no-op but callable)."""
@@ -489,6 +698,15 @@ class TestProsodyExtractor:
         # 440Hz is above 200Hz threshold, so should be 'High'
         assert result['pitch'] == 'High'
     
+    def test_yinfast_matches_yin_tags(self):
+        """Test the default FFT-based method classifies like direct YIN."""
+        audio_buffer = generate_sine_wave(frequency=440.0, duration=0.5, amplitude=0.3)
+        
+        fast = ProsodyExtractor(sample_rate=48000).analyze_buffer(audio_buffer)
+        direct = ProsodyExtractor(sample_rate=48000, method='yin').analyze_buffer(audio_buffer)
+        
+        assert fast == direct
+    
     def test_analyze_buffer_with_list(self):
         """Test analyze_buffer handles list input."""
         extractor = ProsodyExtractor(sample_rate=48000)
@@ -503,6 +721,20 @@ class TestProsodyExtractor:
         assert isinstance(result, dict)
         assert 'energy' in result
         assert 'pitch' in result
+    
+    def test_frame_and_energy_pads_tail_once(self):
+        """Test framing zero-pads only the final hop and RMS matches the direct formula."""
+        audio_buffer = np.arange(1, 11, dtype=np.float32)
+        frames, rms = frame_and_energy(audio_buffer, 4)
+        
+        assert frames.shape == (3, 4)
+        assert frames[2].tolist() == [9, 10, 0, 0]
+        assert rms == pytest.approx(np.sqrt(np.mean(audio_buffer ** 2)))
+        
+        # Evenly divisible input is framed without copying
+        even = np.ones(8, dtype=np.float32)
+        frames, _ = frame_and_energy(even, 4)
+        assert np.shares_memory(frames, even)
 
 
 # ============================================================================
@@ -514,30 +746,31 @@ class TestSenderMain:
     
     @pytest.mark.timeout(5)
     def test_audio_producer_queues_chunks(self):
-        """Test audio_producer continuously reads and queues chunks."""
+        """Test audio_producer continuously reads chunks into the capture ring."""
         mock_audio_service = MagicMock()
         mock_audio_service.SAMPLE_RATE = 48000
-        audio_queue = queue.Queue(maxsize=100)
+        audio_ring = ChunkRing(100, 2)
         stop_event = threading.Event()
         
-        # Mock read_chunk to return data 5 times, then set stop_event
+        # Mock read_chunk_into to fill data 5 times, then set stop_event
         # This prevents infinite loops while testing
         call_count = [0]
-        def limited_read_chunk():
+        def limited_read_chunk_into(out):
             call_count[0] += 1
             if call_count[0] > 5:
                 # Set stop event instead of raising exception
                 # The producer checks stop_event in its loop
                 stop_event.set()
-                # Return a chunk anyway (producer will exit on next iteration)
-            return np.array([0.1, 0.2], dtype=np.float32)
+                # Fill a chunk anyway (producer will exit on next iteration)
+            out[:2] = [0.1, 0.2]
+            return 2
         
-        mock_audio_service.read_chunk.side_effect = limited_read_chunk
+        mock_audio_service.read_chunk_into.side_effect = limited_read_chunk_into
         
         # Run producer in thread
         thread = threading.Thread(
             target=audio_producer,
-            args=(mock_audio_service, audio_queue, stop_event),
+            args=(mock_audio_service, audio_ring, stop_event),
             daemon=True
         )
         thread.start()
@@ -547,6 +780,8 @@ class TestSenderMain:
         
         # Should have queued some chunks (at least 5)
         assert call_count[0] > 0
+        assert len(audio_ring) >= 5
+        assert np.allclose(audio_ring.pop_into(np.empty(2, dtype=np.float32)), [0.1, 0.2])
         # Verify stop_event was set
         assert stop_event.is_set()
     
@@ -560,7 +795,7 @@ class TestSenderMain:
         mock_prosody = MagicMock()
         mock_link_sim = MagicMock()  # Phase 3: Link Simulator mock
         
-        audio_queue = queue.Queue()
+        audio_ring = ChunkRing(64, 1536)
         stop_event = threading.Event()
         
         # Setup mocks - explicitly set return values
@@ -569,17 +804,17 @@ class TestSenderMain:
         mock_transcriber.transcribe_buffer.return_value = "test text"
         mock_prosody.analyze_buffer.return_value = {'energy': 'Normal', 'pitch': 'Normal'}
         
-        # Add valid 512-sample chunks to queue (matching CHUNK_SIZE)
+        # Add valid 1536-sample chunks to the ring (matching CHUNK_SIZE)
         # Using proper chunk size prevents silent failures in consumer thread
         # Add 5 speech chunks
         for _ in range(5):
             chunk = generate_audio_chunk(chunk_size=1536)
-            audio_queue.put(chunk)
+            audio_ring.push(chunk)
         
         # Add 30 silence chunks to trigger silence threshold (SILENCE_THRESHOLD_CHUNKS = 15, needs > 15)
         for _ in range(30):
             silence_chunk = np.zeros(1536, dtype=np.float32)
-            audio_queue.put(silence_chunk)
+            audio_ring.push(silence_chunk)
         
         # Set stop event after a delay to ensure consumer has time to process
         def set_stop():
@@ -603,7 +838,7 @@ class TestSenderMain:
             mock_transcriber,
             mock_prosody,
             mock_link_sim,
-            audio_queue,
+            audio_ring,
             mock_executor,
             stop_event
         )
@@ -614,6 +849,65 @@ class TestSenderMain:
         # Phase 3: Verify link simulator transmit was called
         assert mock_link_sim.transmit.called, "Link simulator transmit should have been called after processing speech"
     
+    @pytest.mark.timeout(10)
+    def test_audio_consumer_never_overwrites_a_buffer_in_use(self):
+        """Test utterances queued behind busy jobs never reuse a buffer still being processed."""
+        mock_audio_service = MagicMock()
+        mock_audio_service.SAMPLE_RATE = 48000
+        mock_vad = MagicMock()
+        mock_vad.is_speech.side_effect = lambda chunk: bool(chunk.max() > 0.05)
+        mock_prosody = MagicMock()
+        mock_prosody.analyze_buffer.return_value = {'energy': 'Normal', 'pitch': 'Normal'}
+        mock_link_sim = MagicMock()
+        
+        # Each job holds its buffer until released, so all three utterances
+        # arrive while earlier ones are still being processed
+        release = threading.Event()
+        started = []
+        snapshots = []
+        
+        def transcribe(audio):
+            before = audio.copy()
+            started.append(None)
+            release.wait(timeout=5)
+            snapshots.append((before, audio.copy()))
+            return "test text"
+        
+        mock_transcriber = MagicMock()
+        mock_transcriber.transcribe_buffer.side_effect = transcribe
+        
+        audio_ring = ChunkRing(64, 1536)
+        for level in (0.1, 0.2, 0.3):
+            for _ in range(5):
+                audio_ring.push(np.full(1536, level, dtype=np.float32))
+            for _ in range(16):
+                audio_ring.push(np.zeros(1536, dtype=np.float32))
+        
+        stop_event = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=3)
+        consumer = threading.Thread(
+            target=audio_consumer,
+            args=(mock_audio_service, mock_vad, mock_transcriber, mock_prosody,
+                  mock_link_sim, audio_ring, executor, stop_event),
+            daemon=True,
+        )
+        consumer.start()
+        try:
+            deadline = time.monotonic() + 5
+            while len(started) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            release.set()
+            executor.shutdown(wait=True)
+            stop_event.set()
+            consumer.join(timeout=2)
+        
+        assert len(snapshots) == 3
+        for before, after in snapshots:
+            assert np.array_equal(before, after), "buffer changed while its job was running"
+        assert sorted(round(float(before.max()), 1) for before, _ in snapshots) == [0.1, 0.2, 0.3]
+        assert mock_link_sim.transmit.call_count == 3
+    
     @pytest.mark.timeout(5)
     def test_audio_consumer_hold_mode(self):
         """Test audio_consumer in hold mode bypasses VAD."""
@@ -624,13 +918,13 @@ class TestSenderMain:
         mock_prosody = MagicMock()
         mock_link_sim = MagicMock()  # Phase 3: Link Simulator mock
         
-        audio_queue = queue.Queue()
+        audio_ring = ChunkRing(64, 1536)
         stop_event = threading.Event()
         
-        # Add valid 1536-sample chunks to queue (matching CHUNK_SIZE)
+        # Add valid 1536-sample chunks to the ring (matching CHUNK_SIZE)
         for _ in range(3):
             chunk = generate_audio_chunk(chunk_size=1536)
-            audio_queue.put(chunk)
+            audio_ring.push(chunk)
         
         # Set stop event
         def set_stop():
@@ -648,7 +942,7 @@ class TestSenderMain:
             audio_consumer(
                 mock_audio_service, mock_vad, mock_transcriber, mock_prosody,
                 mock_link_sim,  # Phase 3: Pass link simulator
-                audio_queue, MagicMock(), # executor
+                audio_ring, MagicMock(), # executor
                 stop_event
             )
         except Exception as e:
@@ -668,7 +962,7 @@ class TestSenderMain:
         mock_prosody = MagicMock()
         mock_link_sim = MagicMock()  # Phase 3: Link Simulator mock
         
-        audio_queue = queue.Queue()
+        audio_ring = ChunkRing(64, 1536)
         stop_event = threading.Event()
         
         # Add silence chunks (VAD returns False) - use valid 512-sample chunks
@@ -677,7 +971,7 @@ class TestSenderMain:
         for _ in range(20):  # More than SILENCE_THRESHOLD_CHUNKS (6)
             # Generate silence chunk with proper size
             silence_chunk = np.zeros(1536, dtype=np.float32)
-            audio_queue.put(silence_chunk)
+            audio_ring.push(silence_chunk)
         
         # Set stop event immediately to prevent infinite loop
         stop_event.set()
@@ -687,7 +981,7 @@ class TestSenderMain:
             audio_consumer(
                 mock_audio_service, mock_vad, mock_transcriber, mock_prosody,
                 mock_link_sim,  # Phase 3: Pass link simulator
-                audio_queue, MagicMock(), # executor
+                audio_ring, MagicMock(), # executor
                 stop_event
             )
         except Exception:
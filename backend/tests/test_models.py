@@ -0,0 +1,30 @@
+"""
+Test Suite for the Shared Model Accessors
+Tests the load-once caching behind the process-wide model instances.
+"""
+
+import threading
+import time
+
+from backend.services.models import load_once
+
+
+def test_load_once_builds_a_single_instance_under_concurrent_first_use():
+    """Racing first calls from several threads share one factory invocation."""
+    calls = []
+
+    @load_once
+    def load():
+        calls.append(None)
+        time.sleep(0.05)  # widen the window a racing caller would slip through
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(load())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
@@ -224,6 +224,18 @@ class TestPromptConstruction:
         result = synthesizer._generate_semantic_audio(packet)
         call_args = mock_client.tts.convert.call_args
         assert call_args.kwargs['text'].startswith('(relaxed)')
+        
+        # Test Deep pitch + Quiet energy (ProsodyExtractor's tags) -> sad
+        packet.prosody = {'energy': 'Quiet', 'pitch': 'Deep'}
+        result = synthesizer._generate_semantic_audio(packet)
+        call_args = mock_client.tts.convert.call_args
+        assert call_args.kwargs['text'].startswith('(sad)')
+        
+        # Test unknown pitch + Loud energy -> energy-only fallback, shouting
+        packet.prosody = {'energy': 'Loud', 'pitch': 'Unknown'}
+        result = synthesizer._generate_semantic_audio(packet)
+        call_args = mock_client.tts.convert.call_args
+        assert call_args.kwargs['text'].startswith('(shouting)')
 
 
 # ============================================================================
@@ -275,6 +287,35 @@ class TestMorseCodeGeneration:
         assert duration_seconds > 2.0  # At least 2 seconds
         assert duration_seconds < 5.0  # Less than 5 seconds
 
+    @patch('backend.services.synthesizer.FishAudio')
+    def test_synthesize_into_matches_morse_bytes(self, mock_client_class):
+        """Verify synthesize_into renders the same Morse PCM into a caller buffer."""
+        synthesizer = Synthesizer(api_key="test_key")
+        packet = JanusPacket(text="SOS", mode=JanusMode.MORSE_CODE, prosody={})
+        expected = synthesizer.synthesize(packet)
+
+        out = np.empty(len(expected), dtype=np.int16)
+        samples = synthesizer.synthesize_into(packet, out)
+        assert np.shares_memory(samples, out)
+        assert samples.tobytes() == expected
+
+        # Audio longer than the buffer gets its own array instead of being cut
+        short = np.empty(100, dtype=np.int16)
+        samples = synthesizer.synthesize_into(packet, short)
+        assert not np.shares_memory(samples, short)
+        assert samples.tobytes() == expected
+
+    @patch('backend.services.synthesizer.FishAudio')
+    def test_synthesize_into_keeps_long_tts_audio(self, mock_client_class):
+        """Verify remote TTS audio longer than the caller buffer is returned whole."""
+        synthesizer = Synthesizer(api_key="test_key")
+        audio_bytes = np.arange(500, dtype=np.int16).tobytes()
+        packet = JanusPacket(text="Hello", mode=JanusMode.TEXT_ONLY, prosody={})
+
+        with patch.object(synthesizer, 'synthesize', return_value=audio_bytes):
+            samples = synthesizer.synthesize_into(packet, np.empty(100, dtype=np.int16))
+        assert samples.tobytes() == audio_bytes
+
 
 # ============================================================================
 # API Failure Fallback Tests
@@ -25,14 +25,14 @@ from backend.services.synthesizer import Synthesizer
 class TestVoiceVerificationAPI:
     """Tests for /api/voice/verify endpoint."""
     
-    @patch('backend.api.endpoints.Transcriber')
+    @patch('backend.api.endpoints.get_transcriber')
     @patch('builtins.open', new_callable=mock_open)
-    def test_verify_voice_success(self, mock_file_open, mock_transcriber_class):
+    def test_verify_voice_success(self, mock_file_open, mock_get_transcriber):
         """Test successful voice verification with matching transcript."""
         # Setup mock transcriber
         mock_transcriber_instance = MagicMock()
         mock_transcriber_instance.transcribe_file.return_value = "The quick brown fox jumps over the lazy dog."
-        mock_transcriber_class.return_value = mock_transcriber_instance
+        mock_get_transcriber.return_value = mock_transcriber_instance
         
         # Create TestClient
         client = TestClient(app)
@@ -54,14 +54,14 @@ class TestVoiceVerificationAPI:
         # Verify transcriber was called
         mock_transcriber_instance.transcribe_file.assert_called_once()
     
-    @patch('backend.api.endpoints.Transcriber')
+    @patch('backend.api.endpoints.get_transcriber')
     @patch('builtins.open', new_callable=mock_open)
-    def test_verify_voice_failure(self, mock_file_open, mock_transcriber_class):
+    def test_verify_voice_failure(self, mock_file_open, mock_get_transcriber):
         """Test failed voice verification with non-matching transcript."""
         # Setup mock transcriber
         mock_transcriber_instance = MagicMock()
         mock_transcriber_instance.transcribe_file.return_value = "Something completely different."
-        mock_transcriber_class.return_value = mock_transcriber_instance
+        mock_get_transcriber.return_value = mock_transcriber_instance
         
         # Create TestClient
         client = TestClient(app)
@@ -149,3 +149,22 @@ class TestSynthesizerHotReload:
         # Verify getmtime was called to check for changes
         assert mock_getmtime.call_count >= 1
 
+
+    @patch('backend.services.synthesizer.os.path.getmtime')
+    @patch('backend.services.synthesizer.os.path.exists')
+    @patch('builtins.open', new_callable=mock_open)
+    def test_reference_payload_reused_until_reload(self, mock_file_open, mock_exists, mock_getmtime, mock_client_class):
+        """Test that requests share one reference payload until the file changes."""
+        mock_exists.return_value = True
+        mock_getmtime.return_value = 100.0
+        mock_file_open.return_value.read.return_value = b'fake audio data'
+        
+        synthesizer = Synthesizer(api_key="test_key", reference_audio_path="dummy.wav")
+        first = synthesizer._references
+        
+        synthesizer._check_and_reload_reference_audio()
+        assert synthesizer._references is first
+        
+        mock_getmtime.return_value = 200.0
+        synthesizer._check_and_reload_reference_audio()
+        assert synthesizer._references is not first